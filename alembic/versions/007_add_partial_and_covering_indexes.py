@@ -0,0 +1,73 @@
+"""add partial indexes for live rows and covering membership index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+# ruff: noqa: I001
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # get_project_tasks: live tasks of a project, in uuid7 (creation) order
+        op.create_index(
+            'ix_tasks_project_id_live',
+            'tasks',
+            ['project_id', 'id'],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        
+        # get_membership / get_user_projects: index-only lookup of a user's role
+        op.create_index(
+            'ix_project_members_user_id_project_id',
+            'project_members',
+            ['user_id', 'project_id'],
+            postgresql_include=['role'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        
+        # Superseded by the covering index above
+        op.drop_index(
+            'ix_project_members_user_id',
+            table_name='project_members',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_project_members_user_id',
+            'project_members',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_project_members_user_id_project_id',
+            table_name='project_members',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_tasks_project_id_live',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
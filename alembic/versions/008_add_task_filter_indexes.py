@@ -0,0 +1,93 @@
+"""add composite indexes for task list filters and sort orders
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+# ruff: noqa: I001
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # status / priority filters
+        op.create_index(
+            'ix_tasks_project_id_status_priority_live',
+            'tasks',
+            ['project_id', 'status', 'priority'],
+            postgresql_where=LIVE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        
+        # due-date ranges and due_date sort (keyset on due_date, id)
+        op.create_index(
+            'ix_tasks_project_id_due_date_live',
+            'tasks',
+            ['project_id', 'due_date', 'id'],
+            postgresql_where=LIVE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        
+        # assignee / unassigned filters
+        op.create_index(
+            'ix_tasks_project_id_assigned_to_live',
+            'tasks',
+            ['project_id', 'assigned_to'],
+            postgresql_where=LIVE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        
+        # updated_since and updated_at sort; not partial so soft-deleted rows are
+        # reachable for change tracking. Also serves the projects FK, which makes
+        # the plain project_id index redundant.
+        op.create_index(
+            'ix_tasks_project_id_updated_at',
+            'tasks',
+            ['project_id', 'updated_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_tasks_project_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_project_id',
+            'tasks',
+            ['project_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name in (
+            'ix_tasks_project_id_updated_at',
+            'ix_tasks_project_id_assigned_to_live',
+            'ix_tasks_project_id_due_date_live',
+            'ix_tasks_project_id_status_priority_live',
+        ):
+            op.drop_index(
+                name,
+                table_name='tasks',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,42 @@
+"""add index for a user's assigned tasks across projects
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+# ruff: noqa: I001
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # GET /users/me/tasks: live tasks assigned to one user, filtered by
+        # status and due date. ix_tasks_assigned_to stays for the users FK.
+        op.create_index(
+            'ix_tasks_assigned_to_status_due_date_live',
+            'tasks',
+            ['assigned_to', 'status', 'due_date'],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_assigned_to_status_due_date_live',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,32 @@
+"""add version columns to tasks and projects
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+"""
+# ruff: noqa: I001
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant default makes these metadata-only; existing rows are not rewritten
+    for table in ('tasks', 'projects'):
+        op.add_column(
+            table,
+            sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in ('projects', 'tasks'):
+        op.drop_column(table, 'version')
@@ -14,10 +14,9 @@ from app.services import user as user_service
 security = HTTPBearer()
 
 
-async def get_current_user(
+async def get_current_user_id(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> UUID:
     token = credentials.credentials
     
     try:
@@ -30,7 +29,7 @@ async def get_current_user(
                 detail="Invalid authentication credentials",
             )
         
-        user_id = UUID(user_id_str)
+        return UUID(user_id_str)
         
     except jwt.ExpiredSignatureError as e:
         raise HTTPException(
@@ -42,9 +41,12 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
         ) from e
-    
-    user = await user_service.get_user_by_id(db, user_id)
-    
+
+
+CurrentUserId = Annotated[UUID, Depends(get_current_user_id)]
+
+
+def ensure_active_user(user: User | None) -> User:
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,4 +62,12 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    user_id: CurrentUserId,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    user = await user_service.get_principal(db, user_id)
+    return ensure_active_user(user)
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
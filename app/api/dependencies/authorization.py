@@ -1,13 +1,18 @@
+from dataclasses import dataclass
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies.auth import CurrentUser
-from app.core.database import get_db
+from app.api.dependencies.auth import CurrentUser, CurrentUserId, ensure_active_user
+from app.core.cache import MISSING
+from app.core.database import get_db, get_read_db
 from app.enums import ProjectRole, SystemRole
+from app.models.project import Project
+from app.models.user import User
 from app.services import project as project_service
+from app.services import user as user_service
 
 
 async def require_system_admin(user: CurrentUser) -> CurrentUser:
@@ -22,34 +27,74 @@ async def require_system_admin(user: CurrentUser) -> CurrentUser:
 SystemAdmin = Annotated[CurrentUser, Depends(require_system_admin)]
 
 
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class ProjectContext:
+    user: User
+    # Only guaranteed for the Load* dependencies below
+    project: Project | None
+    role: ProjectRole
+
+
 class ProjectPermission:
-    
-    def __init__(self, min_role: ProjectRole):
+    """Resolve the caller's role in ``project_id`` and enforce ``min_role``.
+
+    The cached principal and membership answer most checks without a query;
+    the fused user/role/project join only runs on a cache miss, for system
+    admins without a membership, or when ``load_project`` asks for the
+    Project itself.
+    """
+
+    def __init__(self, min_role: ProjectRole, load_project: bool = False):
         self.min_role = min_role
+        self.load_project = load_project
         self._role_hierarchy = {
             ProjectRole.OWNER: 4,
             ProjectRole.ADMIN: 3,
             ProjectRole.MEMBER: 2,
             ProjectRole.VIEWER: 1,
         }
-    
+
+    async def _resolve(
+        self, db: AsyncSession, project_id: UUID, user_id: UUID
+    ) -> tuple[User | None, ProjectRole | None, Project | None, bool]:
+        user = user_service.cached_principal(user_id)
+        if user is not None and not self.load_project:
+            role = await project_service.get_cached_member_role(project_id, user_id)
+            admin = user.system_role == SystemRole.SYSTEM_ADMIN
+            if role is not MISSING and (role is not None or not admin):
+                # Roles are only cached for live projects
+                return user, role, None, role is not None
+
+        user, role, project = await project_service.get_project_context(db, project_id, user_id)
+        return user, role, project, project is not None
+
     async def __call__(
         self,
+        request: Request,
         project_id: UUID,
-        user: CurrentUser,
+        user_id: CurrentUserId,
         db: Annotated[AsyncSession, Depends(get_db)],
-    ) -> ProjectRole:
+        read_db: Annotated[AsyncSession, Depends(get_read_db)],
+    ) -> ProjectContext:
+        # Both sessions are lazy and shared with the handler, so only the one
+        # used here connects; get_read_db already honours the read-your-writes pin
+        session = read_db if request.method in _SAFE_METHODS else db
+        user, role, project, found = await self._resolve(session, project_id, user_id)
+        user = ensure_active_user(user)
+        
         if user.system_role == SystemRole.SYSTEM_ADMIN:
-            return ProjectRole.OWNER
+            role = ProjectRole.OWNER
         
-        membership = await project_service.get_membership(db, project_id, user.id)
-        if not membership:
+        if role is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not a member of this project",
             )
         
-        user_role_level = self._role_hierarchy.get(membership.role, 0)
+        user_role_level = self._role_hierarchy.get(role, 0)
         min_role_level = self._role_hierarchy.get(self.min_role, 0)
         
         if user_role_level < min_role_level:
@@ -58,10 +103,21 @@ class ProjectPermission:
                 detail=f"Requires {self.min_role.value} role or higher",
             )
         
-        return membership.role
+        if not found:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+        
+        return ProjectContext(user=user, project=project, role=role)
+
 
+RequireProjectViewer = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.VIEWER))]
+RequireProjectMember = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.MEMBER))]
+RequireProjectAdmin = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.ADMIN))]
+RequireProjectOwner = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.OWNER))]
 
-RequireProjectViewer = Annotated[ProjectRole, Depends(ProjectPermission(ProjectRole.VIEWER))]
-RequireProjectMember = Annotated[ProjectRole, Depends(ProjectPermission(ProjectRole.MEMBER))]
-RequireProjectAdmin = Annotated[ProjectRole, Depends(ProjectPermission(ProjectRole.ADMIN))]
-RequireProjectOwner = Annotated[ProjectRole, Depends(ProjectPermission(ProjectRole.OWNER))]
+# Same checks, but the handler also gets the Project row
+LoadProjectAsViewer = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.VIEWER, load_project=True))]
+LoadProjectAsAdmin = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.ADMIN, load_project=True))]
+LoadProjectAsOwner = Annotated[ProjectContext, Depends(ProjectPermission(ProjectRole.OWNER, load_project=True))]
@@ -0,0 +1,31 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Header, HTTPException, Response, status
+
+from app.utils.etag import if_match_version
+
+IfNoneMatch = Annotated[str | None, Header(description="Return 304 if the ETag still matches")]
+IfMatch = Annotated[str | None, Header(description="Only apply the write if the ETag still matches")]
+
+
+def not_modified(etag: str, headers: dict[str, str] | None = None) -> Response:
+    """304 for ``etag``; ``headers`` must repeat any Vary the 200 would send."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **(headers or {})})
+
+
+def precondition_failed() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Resource was modified by another request",
+    )
+
+
+def expected_version(if_match: str | None, resource_id: UUID) -> int | None:
+    """Version an If-Match header pins the write to, or None for an unconditional write."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    version = if_match_version(if_match, resource_id)
+    if version is None:
+        raise precondition_failed()
+    return version
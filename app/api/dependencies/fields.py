@@ -0,0 +1,61 @@
+from functools import lru_cache
+from typing import Annotated, Any
+
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.project import ProjectResponse
+from app.schemas.task import TaskResponse
+
+
+class FieldSelection:
+    """Parse a comma-separated ``fields=`` query parameter for a response model.
+
+    Resolves to None when the parameter is absent, otherwise to the requested
+    field names in model order, always including ``id``.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+
+    def __call__(
+        self,
+        fields: Annotated[
+            str | None,
+            Query(description="Comma-separated list of fields to return"),
+        ] = None,
+    ) -> tuple[str, ...] | None:
+        if fields is None:
+            return None
+
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - self.model.model_fields.keys()
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        return tuple(
+            name for name in self.model.model_fields if name in requested or name == "id"
+        )
+
+
+TaskFields = Annotated[tuple[str, ...] | None, Depends(FieldSelection(TaskResponse))]
+ProjectFields = Annotated[tuple[str, ...] | None, Depends(FieldSelection(ProjectResponse))]
+
+
+@lru_cache(maxsize=256)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def sparse_response(
+    response_type: Any, content: Any, headers: dict[str, str] | None = None
+) -> JSONResponse:
+    """Serialize ``content`` as ``response_type``, which is built from partial_model()."""
+    adapter = _adapter(response_type)
+    return JSONResponse(
+        adapter.dump_python(adapter.validate_python(content), mode="json"),
+        headers=headers,
+    )
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Annotated, Any
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Query, status
+from pydantic import ValidationError
+
+from app.enums import TaskPriority, TaskStatus
+from app.schemas.task import TaskFilter
+
+
+def _task_criteria(
+    status_in: Annotated[list[TaskStatus] | None, Query(alias="status")] = None,
+    priority: Annotated[list[TaskPriority] | None, Query()] = None,
+    due_after: datetime | None = None,
+    due_before: datetime | None = None,
+    created_since: datetime | None = None,
+    updated_since: datetime | None = None,
+) -> dict[str, Any]:
+    """Filter parameters shared by every task list, whatever its scope."""
+    return {
+        "status": status_in,
+        "priority": priority,
+        "due_after": due_after,
+        "due_before": due_before,
+        "created_since": created_since,
+        "updated_since": updated_since,
+    }
+
+
+TaskCriteria = Annotated[dict[str, Any], Depends(_task_criteria)]
+
+
+def get_task_filter(
+    criteria: TaskCriteria,
+    assigned_to: UUID | None = None,
+    unassigned: bool = False,
+) -> TaskFilter:
+    try:
+        return TaskFilter(**criteria, assigned_to=assigned_to, unassigned=unassigned)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="assigned_to and unassigned cannot be combined",
+        ) from e
+
+
+def get_assigned_task_filter(criteria: TaskCriteria) -> TaskFilter:
+    return TaskFilter(**criteria)
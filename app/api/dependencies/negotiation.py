@@ -0,0 +1,64 @@
+from typing import Annotated
+
+from fastapi import Depends, Header, HTTPException, status
+
+from app.api.responses import (
+    COLUMNAR_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+)
+
+_JSON_RANGES = {JSON_MEDIA_TYPE, "application/*", "*/*"}
+_MSGPACK_RANGES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+
+# OpenAPI entry for routes whose 200 body can also be msgpack or columnar JSON
+LIST_FORMAT_RESPONSES = {
+    200: {
+        "content": {
+            MSGPACK_MEDIA_TYPE: {},
+            COLUMNAR_MEDIA_TYPE: {},
+        }
+    }
+}
+
+
+def _media_ranges(accept: str) -> list[str]:
+    ranges = []
+    for part in accept.split(","):
+        media_range, *params = (piece.strip() for piece in part.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_range and quality > 0:
+            ranges.append((quality, media_range.lower()))
+    # sorted() is stable, so equal weights keep the client's order
+    return [media_range for _, media_range in sorted(ranges, key=lambda item: -item[0])]
+
+
+def list_media_type(
+    accept: Annotated[str | None, Header(description="application/json, application/msgpack or " + COLUMNAR_MEDIA_TYPE)] = None,
+) -> str:
+    """Pick the list representation from the Accept header, defaulting to JSON."""
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    for media_range in _media_ranges(accept):
+        if media_range in _JSON_RANGES:
+            return JSON_MEDIA_TYPE
+        if media_range == COLUMNAR_MEDIA_TYPE:
+            return COLUMNAR_MEDIA_TYPE
+        if media_range in _MSGPACK_RANGES:
+            return MSGPACK_MEDIA_TYPE
+
+    raise HTTPException(
+        status_code=status.HTTP_406_NOT_ACCEPTABLE,
+        detail=f"Supported media types: {JSON_MEDIA_TYPE}, {COLUMNAR_MEDIA_TYPE}, {MSGPACK_MEDIA_TYPE}",
+    )
+
+
+ListMediaType = Annotated[str, Depends(list_media_type)]
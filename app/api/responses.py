@@ -0,0 +1,136 @@
+import enum
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, get_args
+from uuid import UUID
+
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+COLUMNAR_MEDIA_TYPE = "application/vnd.taskforge.columnar+json"
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson.
+
+    UUIDs, datetimes and enums are encoded natively, with UTC written as
+    ``Z`` the same way Pydantic does, so no jsonable_encoder pass is needed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        # Aware datetimes are packed as msgpack timestamps before reaching here
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to msgpack")
+
+
+class MsgPackResponse(Response):
+    """Response packed with msgpack; aware datetimes use the timestamp extension type."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_msgpack_default, datetime=True)
+
+
+class ColumnarResponse(ORJSONResponse):
+    media_type = COLUMNAR_MEDIA_TYPE
+
+
+def _enum_type(annotation: Any) -> type[enum.Enum] | None:
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, enum.Enum):
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=256)
+def _columnar_layout(
+    model: type[BaseModel], fields: tuple[str, ...] | None
+) -> tuple[tuple[str, ...], dict[str, list[Any]], tuple[tuple[int, dict[enum.Enum, int]], ...]]:
+    keys = tuple(model.model_fields) if fields is None else fields
+    dictionaries = {}
+    codes = []
+    for position, name in enumerate(keys):
+        enum_type = _enum_type(model.model_fields[name].annotation)
+        if enum_type is not None:
+            dictionaries[name] = [member.value for member in enum_type]
+            codes.append((position, {member: index for index, member in enumerate(enum_type)}))
+    return keys, dictionaries, tuple(codes)
+
+
+def columnar_content(
+    model: type[BaseModel], rows: Iterable[Sequence[Any]], fields: Sequence[str] | None = None
+) -> dict[str, Any]:
+    """Lay rows out as column names once plus one array of values per row.
+
+    Enum columns are dictionary-encoded: each value is an index into
+    ``dictionaries[column]``, which lists the enum's values in order.
+    """
+    keys, dictionaries, codes = _columnar_layout(model, None if fields is None else tuple(fields))
+    width = len(keys)
+    values = [list(row[:width]) for row in rows]
+    for position, index in codes:
+        for row in values:
+            if row[position] is not None:
+                row[position] = index[row[position]]
+    return {"columns": list(keys), "dictionaries": dictionaries, "rows": values}
+
+
+def row_items(
+    model: type[BaseModel], rows: Iterable[Sequence[Any]], fields: Sequence[str] | None = None
+) -> list[dict[str, Any]]:
+    """Key each row by ``model``'s fields (or ``fields``), in order.
+
+    Rows come from typed columns, so they are not validated again; trailing
+    columns beyond the keys, such as keyset values, are dropped.
+    """
+    keys = tuple(model.model_fields) if fields is None else tuple(fields)
+    return [dict(zip(keys, row, strict=False)) for row in rows]
+
+
+def rows_response(
+    model: type[BaseModel],
+    rows: Iterable[Sequence[Any]],
+    fields: Sequence[str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> ORJSONResponse:
+    return ORJSONResponse(row_items(model, rows, fields), headers=headers)
+
+
+def page_response(
+    model: type[BaseModel],
+    rows: Iterable[Sequence[Any]],
+    next_cursor: str | None,
+    fields: Sequence[str] | None = None,
+    headers: dict[str, str] | None = None,
+    media_type: str = JSON_MEDIA_TYPE,
+) -> Response:
+    """Render a keyset page as JSON, msgpack or columnar JSON.
+
+    msgpack carries the same ``items``/``next_cursor`` document as JSON; the
+    columnar form replaces ``items`` with ``columns``, ``dictionaries`` and
+    ``rows``.
+    """
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        content = columnar_content(model, rows, fields)
+        content["next_cursor"] = next_cursor
+        return ColumnarResponse(content, headers=headers)
+
+    content = {"items": row_items(model, rows, fields), "next_cursor": next_cursor}
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return MsgPackResponse(content, headers=headers)
+    return ORJSONResponse(content, headers=headers)
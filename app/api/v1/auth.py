@@ -5,7 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.authorization import SystemAdmin
 from app.core.database import get_db
-from app.core.security import create_access_token, verify_password
+from app.core.hashing import password_hasher
+from app.core.security import create_access_token
 from app.schemas.user import LoginRequest, LoginResponse, UserCreate, UserResponse
 from app.services import user as user_service
 
@@ -50,7 +51,7 @@ async def login(
             detail="Invalid email or password",
         )
     
-    if not verify_password(credentials.password, user.hashed_password):
+    if not await password_hasher.verify(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -94,5 +95,6 @@ async def admin_verify_user(
     
     user.is_verified = True
     await db.commit()
+    user_service.invalidate_principal(user.id)
     
     return {"message": f"User {email} verified successfully"}
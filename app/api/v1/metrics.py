@@ -0,0 +1,22 @@
+import os
+
+from fastapi import APIRouter
+
+from app.api.dependencies.authorization import SystemAdmin
+from app.core.database import engine, pool_status, replica_router, session_stats
+from app.core.hashing import password_hasher
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("")
+async def get_metrics(
+    _admin: SystemAdmin,
+):
+    return {
+        "pid": os.getpid(),
+        "database": pool_status(engine),
+        "replicas": replica_router.status(),
+        "sessions": dict(session_stats),
+        "password_hashing": password_hasher.stats(),
+    }
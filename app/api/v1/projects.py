@@ -1,17 +1,29 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import CurrentUser
 from app.api.dependencies.authorization import (
+    LoadProjectAsAdmin,
+    LoadProjectAsOwner,
+    LoadProjectAsViewer,
     RequireProjectAdmin,
-    RequireProjectOwner,
     RequireProjectViewer,
 )
-from app.core.database import get_db
+from app.api.dependencies.conditional import (
+    IfMatch,
+    IfNoneMatch,
+    expected_version,
+    not_modified,
+    precondition_failed,
+)
+from app.api.dependencies.fields import ProjectFields, sparse_response
+from app.api.responses import rows_response
+from app.core.database import get_db, get_read_db
 from app.enums import ProjectRole
+from app.schemas.fields import partial_model
 from app.schemas.project import (
     MemberAddRequest,
     MemberResponse,
@@ -22,10 +34,12 @@ from app.schemas.project import (
 )
 from app.services import project as project_service
 from app.services import user as user_service
+from app.utils.etag import VersionConflictError, etag_matches, resource_etag
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
@@ -40,68 +54,66 @@ async def create_project(
 @router.get("", response_model=list[ProjectResponse])
 async def list_user_projects(
     user: CurrentUser,
-    db: DbSession,
+    db: ReadDbSession,
+    fields: ProjectFields,
 ):
-    return await project_service.get_user_projects(db, user.id)
+    projects = await project_service.get_user_projects(db, user.id, fields)
+    return rows_response(ProjectResponse, projects, fields)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
-    _user: CurrentUser,
-    db: DbSession,
-    _role: RequireProjectViewer,
+    response: Response,
+    ctx: LoadProjectAsViewer,
+    fields: ProjectFields,
+    if_none_match: IfNoneMatch = None,
 ):
-    project = await project_service.get_project(db, project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    return project
+    etag = resource_etag(ctx.project.id, ctx.project.version, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    if fields is not None:
+        return sparse_response(partial_model(ProjectResponse, fields), ctx.project, {"ETag": etag})
+    response.headers["ETag"] = etag
+    return ctx.project
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    _user: CurrentUser,
+    response: Response,
     db: DbSession,
-    _role: RequireProjectAdmin,
+    ctx: LoadProjectAsAdmin,
+    if_match: IfMatch = None,
 ):
-    project = await project_service.get_project(db, project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    return await project_service.update_project(db, project, project_data)
+    version = expected_version(if_match, ctx.project.id)
+    try:
+        project = await project_service.update_project(db, ctx.project, project_data, version)
+    except VersionConflictError as e:
+        raise precondition_failed() from e
+    response.headers["ETag"] = resource_etag(project.id, project.version)
+    return project
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: UUID,
-    _user: CurrentUser,
     db: DbSession,
-    _role: RequireProjectOwner,
+    ctx: LoadProjectAsOwner,
 ):
-    project = await project_service.get_project(db, project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    await project_service.delete_project(db, project)
+    await project_service.delete_project(db, ctx.project)
 
 
 @router.get("/{project_id}/members", response_model=list[MemberResponse])
 async def list_project_members(
     project_id: UUID,
-    _user: CurrentUser,
-    db: DbSession,
-    _role: RequireProjectViewer,
+    db: ReadDbSession,
+    _ctx: RequireProjectViewer,
 ):
-    return await project_service.get_project_members(db, project_id)
+    members = await project_service.get_project_member_rows(db, project_id)
+    return rows_response(MemberResponse, members)
 
 
 @router.post(
@@ -112,17 +124,9 @@ async def list_project_members(
 async def add_project_member(
     project_id: UUID,
     member_data: MemberAddRequest,
-    _user: CurrentUser,
     db: DbSession,
-    _role: RequireProjectAdmin,
+    _ctx: RequireProjectAdmin,
 ):
-    project = await project_service.get_project(db, project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    
     target_user = await user_service.get_user_by_id(db, member_data.user_id)
     if not target_user:
         raise HTTPException(
@@ -147,9 +151,8 @@ async def update_member_role(
     project_id: UUID,
     user_id: UUID,
     role_data: MemberUpdateRequest,
-    _user: CurrentUser,
     db: DbSession,
-    _role: RequireProjectAdmin,
+    _ctx: RequireProjectAdmin,
 ):
     member = await project_service.get_membership(db, project_id, user_id)
     if not member:
@@ -174,9 +177,8 @@ async def update_member_role(
 async def remove_member(
     project_id: UUID,
     user_id: UUID,
-    _user: CurrentUser,
     db: DbSession,
-    _role: RequireProjectAdmin,
+    _ctx: RequireProjectAdmin,
 ):
     member = await project_service.get_membership(db, project_id, user_id)
     if not member:
@@ -0,0 +1,39 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import CurrentUser
+from app.core.config import settings
+from app.core.database import get_read_db
+from app.schemas.pagination import Page
+from app.schemas.task import TaskSearchHit
+from app.services import task as task_service
+from app.utils.cursor import InvalidCursorError
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
+
+
+@router.get("/tasks", response_model=Page[TaskSearchHit])
+async def search_tasks(
+    current_user: CurrentUser,
+    db: ReadDbSession,
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    limit: Annotated[int, Query(ge=1, le=settings.PAGE_MAX_LIMIT)] = settings.PAGE_DEFAULT_LIMIT,
+    cursor: str | None = None,
+):
+    try:
+        hits, next_cursor = await task_service.search_tasks(
+            db, q, limit=limit, cursor=cursor, member_id=current_user.id
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+    return {
+        "items": [{"task": task, "rank": rank} for task, rank in hits],
+        "next_cursor": next_cursor,
+    }
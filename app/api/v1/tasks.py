@@ -1,71 +1,396 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies.auth import CurrentUser
 from app.api.dependencies.authorization import RequireProjectMember
-from app.core.database import get_db
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.api.dependencies.conditional import (
+    IfMatch,
+    IfNoneMatch,
+    expected_version,
+    not_modified,
+    precondition_failed,
+)
+from app.api.dependencies.fields import TaskFields, sparse_response
+from app.api.dependencies.filters import get_task_filter
+from app.api.dependencies.negotiation import LIST_FORMAT_RESPONSES, ListMediaType
+from app.api.responses import page_response
+from app.core.config import settings
+from app.core.database import get_db, get_read_db, open_read_session
+from app.schemas.fields import partial_model
+from app.schemas.pagination import Page
+from app.schemas.task import (
+    TaskBulkCount,
+    TaskBulkCreate,
+    TaskBulkResponse,
+    TaskBulkSelection,
+    TaskBulkUpdate,
+    TaskChanges,
+    TaskCreate,
+    TaskFilter,
+    TaskImportReport,
+    TaskResponse,
+    TaskSearchHit,
+    TaskSort,
+    TaskUpdate,
+)
 from app.services import project as project_service
 from app.services import task as task_service
+from app.services import task_import as task_import_service
+from app.utils.cursor import InvalidCursorError
+from app.utils.etag import VersionConflictError, etag_matches, make_etag, resource_etag
+from app.utils.export import CsvEncoder, NdjsonEncoder, gzip_chunks
+from app.utils.imports import read_csv_records, read_ndjson_records
 
 router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
-
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     project_id: UUID,
     task_data: TaskCreate,
-    user: CurrentUser,
     db: DbSession,
-    _role: RequireProjectMember,
+    ctx: RequireProjectMember,
 ):
-    project = await project_service.get_project(db, project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
     if task_data.assigned_to:
-        assignee = await project_service.get_membership(db, project_id, task_data.assigned_to)
-        if not assignee:
+        assignee_role = await project_service.get_member_role(db, project_id, task_data.assigned_to)
+        if assignee_role is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Assigned user is not a project member",
             )
 
-    return await task_service.create_task(db, project_id, task_data, user.id)
+    return await task_service.create_task(db, project_id, task_data, ctx.user.id)
+
+
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def create_tasks_bulk(
+    project_id: UUID,
+    payload: TaskBulkCreate,
+    db: DbSession,
+    ctx: RequireProjectMember,
+):
+    assignees = {item.assigned_to for item in payload.items if item.assigned_to}
+    members = await project_service.get_member_ids(db, project_id, assignees)
+
+    results = []
+    valid = []
+    for index, item in enumerate(payload.items):
+        if item.assigned_to and item.assigned_to not in members:
+            results.append({"index": index, "error": "Assigned user is not a project member"})
+        else:
+            valid.append(index)
+            results.append({"index": index})
+
+    tasks = await task_service.create_tasks(
+        db, project_id, [payload.items[index] for index in valid], ctx.user.id
+    )
+    for index, task in zip(valid, tasks, strict=True):
+        results[index]["task"] = task
+
+    return {
+        "succeeded": len(valid),
+        "failed": len(results) - len(valid),
+        "results": results,
+    }
+
+
+# TaskUpdate fields backed by NOT NULL columns; an explicit null would fail the whole UPDATE
+_NOT_NULL_FIELDS = ("title", "status", "priority")
+
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def update_tasks_bulk(
+    project_id: UUID,
+    payload: TaskBulkUpdate,
+    db: DbSession,
+    _ctx: RequireProjectMember,
+):
+    patches = [payload.patch] if payload.items is None else [item.patch for item in payload.items]
+    values = [patch.model_dump(exclude_unset=True) for patch in patches]
+    keys = [patch.model_dump_json(exclude_unset=True) for patch in patches]
+    assignees = {v["assigned_to"] for v in values if v.get("assigned_to") is not None}
+    members = await project_service.get_member_ids(db, project_id, assignees)
+
+    def check(patch_values: dict) -> str | None:
+        if not patch_values:
+            return "No fields to update"
+        nulls = [name for name in _NOT_NULL_FIELDS if name in patch_values and patch_values[name] is None]
+        if nulls:
+            return f"{', '.join(nulls)} cannot be null"
+        assignee = patch_values.get("assigned_to")
+        if assignee is not None and assignee not in members:
+            return "Assigned user is not a project member"
+        return None
+
+    if payload.items is None:
+        error = check(values[0])
+        if error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    if payload.filter is not None:
+        try:
+            tasks = await task_service.update_matching_tasks(
+                db, project_id, payload.filter, values[0], max_rows=settings.TASK_BULK_MAX_ITEMS
+            )
+        except task_service.TooManyTasksError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        return {
+            "succeeded": len(tasks),
+            "failed": 0,
+            "results": [{"index": index, "task": task} for index, task in enumerate(tasks)],
+        }
+
+    if payload.ids is not None:
+        targets = [(task_id, keys[0], values[0]) for task_id in payload.ids]
+    else:
+        targets = [(item.id, key, v) for item, key, v in zip(payload.items, keys, values, strict=True)]
+
+    # Items sharing an identical patch go out as a single UPDATE
+    errors = {}
+    groups: dict[str, tuple[list[UUID], dict]] = {}
+    for index, (task_id, key, patch_values) in enumerate(targets):
+        error = check(patch_values)
+        if error:
+            errors[index] = error
+            continue
+        groups.setdefault(key, ([], patch_values))[0].append(task_id)
+
+    updated = await task_service.update_tasks(db, project_id, list(groups.values()))
 
+    results = []
+    for index, (task_id, _, _) in enumerate(targets):
+        if index in errors:
+            results.append({"index": index, "error": errors[index]})
+        elif task_id in updated:
+            results.append({"index": index, "task": updated[task_id]})
+        else:
+            results.append({"index": index, "error": "Task not found"})
 
-@router.get("", response_model=list[TaskResponse])
+    succeeded = sum(1 for result in results if "task" in result)
+    return {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
+
+
+@router.post("/bulk/delete", response_model=TaskBulkCount)
+async def delete_tasks_bulk(
+    project_id: UUID,
+    selection: TaskBulkSelection,
+    db: DbSession,
+    _ctx: RequireProjectMember,
+):
+    affected = await task_service.soft_delete_tasks(
+        db, project_id, ids=selection.ids, filters=selection.filter
+    )
+    return {"affected": affected}
+
+
+@router.post("/bulk/restore", response_model=TaskBulkCount)
+async def restore_tasks_bulk(
+    project_id: UUID,
+    selection: TaskBulkSelection,
+    db: DbSession,
+    _ctx: RequireProjectMember,
+):
+    affected = await task_service.restore_tasks(
+        db, project_id, ids=selection.ids, filters=selection.filter
+    )
+    return {"affected": affected}
+
+
+@router.get("", response_model=Page[TaskResponse], responses=LIST_FORMAT_RESPONSES)
 async def list_project_tasks(
     project_id: UUID,
-    _user: CurrentUser,
+    request: Request,
+    db: ReadDbSession,
+    _ctx: RequireProjectMember,
+    filters: Annotated[TaskFilter, Depends(get_task_filter)],
+    fields: TaskFields,
+    media_type: ListMediaType,
+    if_none_match: IfNoneMatch = None,
+    sort: TaskSort = "created_at",
+    limit: Annotated[int, Query(ge=1, le=settings.PAGE_MAX_LIMIT)] = settings.PAGE_DEFAULT_LIMIT,
+    cursor: str | None = None,
+):
+    # Any change to the project's tasks changes the aggregate, so the page
+    # itself never has to be loaded to answer a matching poll
+    state = await task_service.get_project_tasks_state(db, project_id)
+    etag = make_etag(project_id, *state, sorted(request.query_params.multi_items()), media_type)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, {"Vary": "Accept"})
+
+    try:
+        tasks, next_cursor = await task_service.get_project_tasks(
+            db, project_id, limit=limit, cursor=cursor, filters=filters, sort=sort, fields=fields
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+    return page_response(TaskResponse, tasks, next_cursor, fields, {"ETag": etag, "Vary": "Accept"}, media_type)
+
+
+async def _export_chunks(project_id: UUID, filters: TaskFilter, encoder: CsvEncoder | NdjsonEncoder):
+    # The request's own session is closed before the body is streamed
+    db = open_read_session()
+    try:
+        yield encoder.header()
+        async for rows in task_service.stream_project_tasks(
+            db, project_id, filters=filters, batch_size=settings.TASK_EXPORT_BATCH_SIZE
+        ):
+            yield encoder.encode(rows)
+    finally:
+        await db.close()
+
+
+@router.get("/export")
+async def export_project_tasks(
+    project_id: UUID,
+    _ctx: RequireProjectMember,
+    filters: Annotated[TaskFilter, Depends(get_task_filter)],
+    export_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson",
+    gzip: bool = False,
+):
+    encoder = CsvEncoder(TaskResponse) if export_format == "csv" else NdjsonEncoder(TaskResponse)
+    chunks = _export_chunks(project_id, filters, encoder)
+    filename = f"tasks-{project_id}.{encoder.extension}"
+    media_type = encoder.media_type
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", response_model=TaskImportReport)
+async def import_project_tasks(
+    project_id: UUID,
+    request: Request,
     db: DbSession,
-    _role: RequireProjectMember,
+    ctx: RequireProjectMember,
+    import_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson",
+):
+    reader = read_csv_records if import_format == "csv" else read_ndjson_records
+    report = await task_import_service.start_import(project_id)
+    return await task_import_service.import_tasks(
+        db,
+        report,
+        reader(request.stream()),
+        ctx.user.id,
+        batch_size=settings.TASK_IMPORT_BATCH_SIZE,
+    )
+
+
+@router.get("/imports", response_model=list[TaskImportReport])
+async def list_task_imports(
+    project_id: UUID,
+    _ctx: RequireProjectMember,
 ):
-    return await task_service.get_project_tasks(db, project_id)
+    return await task_import_service.list_imports(project_id)
+
+
+@router.get("/imports/{import_id}", response_model=TaskImportReport)
+async def get_task_import(
+    project_id: UUID,
+    import_id: UUID,
+    _ctx: RequireProjectMember,
+):
+    report = await task_import_service.get_import(project_id, import_id)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import not found",
+        )
+    return report
+
+
+@router.get("/changes", response_model=TaskChanges)
+async def list_task_changes(
+    project_id: UUID,
+    db: ReadDbSession,
+    _ctx: RequireProjectMember,
+    since: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=settings.PAGE_MAX_LIMIT)] = settings.PAGE_MAX_LIMIT,
+):
+    try:
+        tasks, watermark, has_more = await task_service.get_task_changes(
+            db, project_id, since=since, limit=limit, settle_seconds=settings.TASK_SYNC_SETTLE_SECONDS
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid watermark",
+        ) from e
+    return {
+        "updated": [task for task in tasks if task.deleted_at is None],
+        "deleted": [task for task in tasks if task.deleted_at is not None],
+        "watermark": watermark,
+        "has_more": has_more,
+    }
+
+
+@router.get("/search", response_model=Page[TaskSearchHit])
+async def search_project_tasks(
+    project_id: UUID,
+    db: ReadDbSession,
+    _ctx: RequireProjectMember,
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    limit: Annotated[int, Query(ge=1, le=settings.PAGE_MAX_LIMIT)] = settings.PAGE_DEFAULT_LIMIT,
+    cursor: str | None = None,
+):
+    try:
+        hits, next_cursor = await task_service.search_tasks(
+            db, q, limit=limit, cursor=cursor, project_id=project_id
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+    return {
+        "items": [{"task": task, "rank": rank} for task, rank in hits],
+        "next_cursor": next_cursor,
+    }
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     project_id: UUID,
     task_id: UUID,
-    _user: CurrentUser,
-    db: DbSession,
-    _role: RequireProjectMember,
+    response: Response,
+    db: ReadDbSession,
+    _ctx: RequireProjectMember,
+    fields: TaskFields,
+    if_none_match: IfNoneMatch = None,
 ):
-    task = await task_service.get_task(db, task_id)
+    if if_none_match:
+        version = await task_service.get_task_version(db, project_id, task_id)
+        if version is not None:
+            etag = resource_etag(task_id, version, fields)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    task = await task_service.get_task(db, task_id, fields)
     if not task or task.project_id != project_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
+
+    etag = resource_etag(task.id, task.version, fields)
+    if fields is not None:
+        return sparse_response(partial_model(TaskResponse, fields), task, {"ETag": etag})
+    response.headers["ETag"] = etag
     return task
 
 
@@ -74,9 +399,10 @@ async def update_task(
     project_id: UUID,
     task_id: UUID,
     task_data: TaskUpdate,
-    _user: CurrentUser,
+    response: Response,
     db: DbSession,
-    _role: RequireProjectMember,
+    _ctx: RequireProjectMember,
+    if_match: IfMatch = None,
 ):
     task = await task_service.get_task(db, task_id)
     if not task or task.project_id != project_id:
@@ -85,24 +411,32 @@ async def update_task(
             detail="Task not found",
         )
 
+    version = expected_version(if_match, task_id)
+    if version is not None and task.version != version:
+        raise precondition_failed()
+
     if task_data.assigned_to is not None:
-        assignee = await project_service.get_membership(db, project_id, task_data.assigned_to)
-        if not assignee:
+        assignee_role = await project_service.get_member_role(db, project_id, task_data.assigned_to)
+        if assignee_role is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Assigned user is not a project member",
             )
 
-    return await task_service.update_task(db, task, task_data)
+    try:
+        task = await task_service.update_task(db, task, task_data, version)
+    except VersionConflictError as e:
+        raise precondition_failed() from e
+    response.headers["ETag"] = resource_etag(task.id, task.version)
+    return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     project_id: UUID,
     task_id: UUID,
-    _user: CurrentUser,
     db: DbSession,
-    _role: RequireProjectMember,
+    _ctx: RequireProjectMember,
 ):
     task = await task_service.get_task(db, task_id)
     if not task or task.project_id != project_id:
@@ -1,20 +1,30 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import CurrentUser
 from app.api.dependencies.authorization import SystemAdmin
-from app.core.database import get_db
+from app.api.dependencies.fields import TaskFields
+from app.api.dependencies.filters import get_assigned_task_filter
+from app.api.dependencies.negotiation import LIST_FORMAT_RESPONSES, ListMediaType
+from app.api.responses import page_response
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
 from app.enums import SystemRole
+from app.schemas.pagination import Page
+from app.schemas.task import TaskFilter, TaskResponse, TaskSort
 from app.schemas.user import UserResponse, UserUpdate
+from app.services import task as task_service
 from app.services import user as user_service
+from app.utils.cursor import InvalidCursorError
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
 
 
 class SystemRoleUpdate(BaseModel):
@@ -53,6 +63,30 @@ async def update_current_user_profile(
     return await user_service.update_user(db, current_user, user_in)
 
 
+@router.get("/me/tasks", response_model=Page[TaskResponse], responses=LIST_FORMAT_RESPONSES)
+async def list_my_tasks(
+    current_user: CurrentUser,
+    db: ReadDbSession,
+    filters: Annotated[TaskFilter, Depends(get_assigned_task_filter)],
+    fields: TaskFields,
+    media_type: ListMediaType,
+    sort: TaskSort = "created_at",
+    limit: Annotated[int, Query(ge=1, le=settings.PAGE_MAX_LIMIT)] = settings.PAGE_DEFAULT_LIMIT,
+    cursor: str | None = None,
+):
+    try:
+        tasks, next_cursor = await task_service.get_assigned_tasks(
+            db, current_user.id, limit=limit, cursor=cursor, filters=filters, sort=sort, fields=fields
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+    return page_response(TaskResponse, tasks, next_cursor, fields, {"Vary": "Accept"}, media_type)
+
+
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_current_user_account(
     current_user: CurrentUser,
@@ -77,5 +111,6 @@ async def update_user_system_role(
     
     user.system_role = role_data.system_role
     await db.commit()
+    user_service.invalidate_principal(user.id)
     await db.refresh(user)
     return user
@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.core.config import settings
+
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded in-process LRU cache whose entries expire after a TTL.
+
+    Safe to share between concurrent requests and worker threads; every
+    operation holds a short lock and never awaits.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if not self.enabled:
+            return
+
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def items_matching(self, predicate: Callable[[Hashable], bool]) -> list[tuple[Hashable, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (expires_at, value) in self._data.items()
+                if expires_at > now and predicate(key)
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MemoryCacheBackend:
+    """Per-process string cache with the same async interface as RedisCacheBackend."""
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        self.namespace = namespace
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> str | None:
+        return self._cache.get(key, None)
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self._cache.delete_matching(lambda key: key.startswith(prefix))
+
+    async def get_prefix(self, prefix: str) -> dict[str, str]:
+        return dict(self._cache.items_matching(lambda key: key.startswith(prefix)))
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+
+class RedisCacheBackend:
+    """String cache shared by every worker through Redis."""
+
+    def __init__(self, namespace: str, url: str, ttl: float):
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+
+        self.namespace = namespace
+        self.ttl = ttl
+        self._redis = Redis.from_url(url, decode_responses=True)
+
+    def _key(self, key: str) -> str:
+        return f"taskforge:{self.namespace}:{key}"
+
+    async def get(self, key: str) -> str | None:
+        return await self._redis.get(self._key(key))
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        await self._redis.set(self._key(key), value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self._key(key))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._key(prefix)}*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+    async def get_prefix(self, prefix: str) -> dict[str, str]:
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._key(prefix)}*")]
+        if not keys:
+            return {}
+        strip = len(self._key(""))
+        values = await self._redis.mget(keys)
+        return {key[strip:]: value for key, value in zip(keys, values, strict=True) if value is not None}
+
+    async def clear(self) -> None:
+        await self.delete_prefix("")
+
+
+CacheBackend = MemoryCacheBackend | RedisCacheBackend
+
+
+def create_cache_backend(namespace: str, maxsize: int, ttl: float) -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.REDIS_URL:
+            raise RuntimeError("CACHE_BACKEND=redis requires REDIS_URL")
+        return RedisCacheBackend(namespace, settings.REDIS_URL, ttl)
+    return MemoryCacheBackend(namespace, maxsize, ttl)
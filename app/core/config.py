@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -19,6 +19,23 @@ class Settings(BaseSettings):
     REDOC_URL: str | None = f"{VERSION_PREFIX}/redoc"
     ENV: str = "development"
 
+    # Pagination
+    PAGE_DEFAULT_LIMIT: int = 50
+    PAGE_MAX_LIMIT: int = 200
+
+    # Bulk task endpoints
+    TASK_BULK_MAX_ITEMS: int = 500
+    TASK_EXPORT_BATCH_SIZE: int = 1000
+    TASK_IMPORT_BATCH_SIZE: int = 5000
+    TASK_IMPORT_MAX_ERRORS: int = 100
+    # Import progress reports live in the CACHE_BACKEND cache, so they are
+    # per worker with "memory" and shared across workers with "redis"
+    TASK_IMPORT_REPORT_TTL_SECONDS: float = 3600
+
+    # Task sync: changes newer than this are held back from /changes so transactions
+    # that commit late (or replica lag) cannot slip in behind a handed-out watermark
+    TASK_SYNC_SETTLE_SECONDS: float = 5
+
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
 
@@ -26,6 +43,26 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+
+    # Principal cache (set TTL to 0 to disable)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    # Shared caches ("redis" lets every worker see the same entries)
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    REDIS_URL: str | None = None
+
+    # Project membership cache
+    MEMBERSHIP_CACHE_TTL_SECONDS: float = 30
+    MEMBERSHIP_CACHE_NEGATIVE_TTL_SECONDS: float = 5
+    MEMBERSHIP_CACHE_MAX_SIZE: int = 50_000
+
+    # Password hashing pool
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
 
     # Database
     POSTGRES_USER: str
@@ -34,6 +71,23 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int
     POSTGRES_DB: str
 
+    # Connection pool (per worker)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_CONNECT_TIMEOUT: float = 10
+    # PgBouncer in transaction mode cannot keep named prepared statements
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+
+    # Read replicas ("host" or "host:port", same credentials and database as the primary)
+    POSTGRES_REPLICA_HOSTS: List[str] = []
+    REPLICA_RETRY_SECONDS: float = 30
+    # Route a user's reads to the primary for this long after they write (0 disables)
+    READ_YOUR_WRITES_SECONDS: float = 0
+
     @property 
     def DATABASE_URL(self) -> str:
         return (
@@ -42,5 +96,17 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def REPLICA_DATABASE_URLS(self) -> list[str]:
+        urls = []
+        for replica in self.POSTGRES_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            urls.append(
+                f"postgresql+asyncpg://"
+                f"{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+                f"@{host}:{port or self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+            )
+        return urls
+
 
 settings = Settings()
@@ -1,15 +1,156 @@
+import itertools
+import time
+from typing import Any
+from uuid import uuid4
+
+import jwt
+from fastapi import Request
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from app.core.cache import create_cache_backend
 from app.core.config import settings
+from app.core.security import decode_token
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection.
+
+    Time spent opening a new (overflow) connection is tracked separately as
+    connect time, so the wait figures only reflect pool saturation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.connect_seconds_total = 0.0
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        elapsed = time.perf_counter() - started
+        self.connects += 1
+        self.connect_seconds_total += elapsed
+        # Consumed by the _do_get() that created it, so its wait excludes the connect
+        record._connect_seconds = elapsed
+        return record
+
+    def _record_wait(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            self._record_wait(time.perf_counter() - started)
+            raise
+        connect_seconds = record.__dict__.pop("_connect_seconds", 0.0)
+        self._record_wait(time.perf_counter() - started - connect_seconds)
+        return record
+
+
+def engine_options() -> dict:
+    if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        connect_args = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    connect_args["timeout"] = settings.DB_CONNECT_TIMEOUT
+
+    return {
+        "echo": False,
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def pool_status(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    status = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if isinstance(pool, InstrumentedPool):
+        status.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_seconds_total=pool.wait_seconds_total,
+            wait_seconds_max=pool.wait_seconds_max,
+            connects=pool.connects,
+            connect_seconds_total=pool.connect_seconds_total,
+        )
+    return status
+
+
+class ReplicaRouter:
+    """Round-robins reads across replicas, skipping ones that recently failed."""
+
+    def __init__(self, engines: list[AsyncEngine], retry_seconds: float):
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._counter = itertools.count()
+        self._down_until: dict[int, float] = {}
+
+    def candidates(self) -> list[AsyncEngine]:
+        if not self.engines:
+            return []
+        start = next(self._counter) % len(self.engines)
+        now = time.monotonic()
+        ordered = self.engines[start:] + self.engines[:start]
+        return [e for e in ordered if self._down_until.get(id(e), 0) <= now]
+
+    def mark_down(self, engine: AsyncEngine) -> None:
+        self._down_until[id(engine)] = time.monotonic() + self.retry_seconds
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
+    def status(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "host": e.url.host,
+                "healthy": self._down_until.get(id(e), 0) <= now,
+                "pool": pool_status(e),
+            }
+            for e in self.engines
+        ]
+
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options())
+
+replica_router = ReplicaRouter(
+    [create_async_engine(url, **engine_options()) for url in settings.REPLICA_DATABASE_URLS],
+    retry_seconds=settings.REPLICA_RETRY_SECONDS,
+)
+
+primary_pins = create_cache_backend(
+    "primary-pin",
+    maxsize=100_000,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -20,6 +161,177 @@ AsyncSessionLocal = async_sessionmaker(
 class Base(DeclarativeBase):
     pass
 
-async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
+
+@event.listens_for(Session, "after_begin")
+def _mark_connected(session, _transaction, _connection):
+    session.info["connected"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session, _flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+class LazySession:
+    """Stands in for an AsyncSession and only opens one on first use.
+
+    ``replicas`` are tried in order when the session is first awaited; a
+    replica that cannot hand out a connection is marked down and the next one
+    (finally the primary) is used instead.
+    """
+
+    def __init__(self, replicas: list[AsyncEngine] | None = None):
+        self._replicas = replicas or []
+        self._session: AsyncSession | None = None
+
+    async def _open(self) -> AsyncSession:
+        if self._session is not None:
+            return self._session
+
+        for replica in self._replicas:
+            session = AsyncSessionLocal(bind=replica)
+            try:
+                await session.connection()
+            except (OSError, exc.DBAPIError, exc.TimeoutError):
+                await session.close()
+                replica_router.mark_down(replica)
+                continue
+            self._session = session
+            return session
+
+        self._session = AsyncSessionLocal()
+        return self._session
+
+    def _open_sync(self) -> AsyncSession:
+        if self._session is None:
+            self._session = AsyncSessionLocal()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._open_sync(), name)
+
+    @property
+    def touched(self) -> bool:
+        return self._session is not None and self._session.info.get("connected", False)
+
+    @property
+    def wrote(self) -> bool:
+        return self._session is not None and self._session.info.get("wrote", False)
+
+    async def execute(self, *args, **kwargs):
+        return await (await self._open()).execute(*args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await (await self._open()).scalar(*args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return await (await self._open()).scalars(*args, **kwargs)
+
+    async def stream(self, *args, **kwargs):
+        return await (await self._open()).stream(*args, **kwargs)
+
+    async def stream_scalars(self, *args, **kwargs):
+        return await (await self._open()).stream_scalars(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await (await self._open()).get(*args, **kwargs)
+
+    async def merge(self, *args, **kwargs):
+        return await (await self._open()).merge(*args, **kwargs)
+
+    async def refresh(self, *args, **kwargs):
+        return await (await self._open()).refresh(*args, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        return await (await self._open()).delete(*args, **kwargs)
+
+    async def flush(self, *args, **kwargs):
+        return await (await self._open()).flush(*args, **kwargs)
+
+    async def connection(self, *args, **kwargs):
+        return await (await self._open()).connection(*args, **kwargs)
+
+    async def run_sync(self, *args, **kwargs):
+        return await (await self._open()).run_sync(*args, **kwargs)
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+def open_read_session() -> LazySession:
+    """Replica-routed session for work that outlives the request's dependencies,
+    such as a streaming response body. The caller must close it.
+    """
+    return LazySession(replica_router.candidates())
+
+
+session_stats = {"requests": 0, "requests_without_db": 0}
+
+
+def _track_session(request: Request) -> None:
+    request.state.db_sessions = getattr(request.state, "db_sessions", 0) + 1
+
+
+def _release_session(request: Request, session: LazySession) -> None:
+    state = request.state
+    state.db_touched = getattr(state, "db_touched", False) or session.touched
+    state.db_sessions -= 1
+    if state.db_sessions == 0:
+        session_stats["requests"] += 1
+        if not state.db_touched:
+            session_stats["requests_without_db"] += 1
+
+
+def _request_user_key(request: Request) -> str | None:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_token(token).get("sub")
+    except jwt.InvalidTokenError:
+        return None
+
+
+async def get_db(request: Request) -> AsyncSession:
+    session = LazySession()
+    _track_session(request)
+    try:
+        yield session
+
+        if session.wrote and settings.READ_YOUR_WRITES_SECONDS > 0:
+            user_key = _request_user_key(request)
+            if user_key:
+                await primary_pins.set(user_key, "1")
+    finally:
+        await session.close()
+        _release_session(request, session)
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    pinned = False
+    if settings.READ_YOUR_WRITES_SECONDS > 0:
+        user_key = _request_user_key(request)
+        pinned = bool(user_key) and await primary_pins.get(user_key) is not None
+
+    session = LazySession([] if pinned else replica_router.candidates())
+    _track_session(request)
+    try:
         yield session
+    finally:
+        await session.close()
+        _release_session(request, session)
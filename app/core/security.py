@@ -1,13 +1,21 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import jwt
 from pwdlib import PasswordHash
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 pwd_hash = PasswordHash.recommended()
 
+token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
 
 def hash_password(password: str) -> str:
     return pwd_hash.hash(password)
@@ -34,4 +42,16 @@ def create_access_token(user_id: UUID, expires_delta: timedelta | None = None) -
 
 
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, settings.ACCESS_TOKEN_SECRET_KEY, algorithms=[settings.ALGORITHM])
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key, None)
+    if payload is not None:
+        if payload["exp"] <= time.time():
+            token_cache.delete(key)
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return dict(payload)
+
+    payload = jwt.decode(token, settings.ACCESS_TOKEN_SECRET_KEY, algorithms=[settings.ALGORITHM])
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, payload, ttl=exp - time.time())
+    return dict(payload)
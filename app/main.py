@@ -1,8 +1,26 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.api.v1 import auth, health, projects, root, tasks, users
+from app.api.v1 import auth, health, metrics, projects, root, search, tasks, users
 from app.core.config import settings
+from app.core.hashing import HashingOverloadedError, password_hasher
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    password_hasher.shutdown()
+
+
+async def hashing_overloaded_handler(_request: Request, exc: HashingOverloadedError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry later"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 def create_app() -> FastAPI:
@@ -12,6 +30,7 @@ def create_app() -> FastAPI:
         version=settings.APP_VERSION,
         docs_url=settings.DOCS_URL,
         redoc_url=settings.REDOC_URL,
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -22,12 +41,16 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.add_exception_handler(HashingOverloadedError, hashing_overloaded_handler)
+
     app.include_router(root.router)
     app.include_router(health.router, prefix=settings.VERSION_PREFIX)
     app.include_router(auth.router, prefix=settings.VERSION_PREFIX)
     app.include_router(users.router, prefix=settings.VERSION_PREFIX)
     app.include_router(projects.router, prefix=settings.VERSION_PREFIX)
     app.include_router(tasks.router, prefix=settings.VERSION_PREFIX)
+    app.include_router(search.router, prefix=settings.VERSION_PREFIX)
+    app.include_router(metrics.router, prefix=settings.VERSION_PREFIX)
 
     return app
 
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -28,6 +28,10 @@ class Project(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Bumped by every UPDATE, like updated_at; guards conditional (If-Match) writes
+    version: Mapped[int] = mapped_column(
+        Integer, server_default=text("1"), onupdate=text("version + 1"), nullable=False
+    )
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -41,6 +45,12 @@ class ProjectMember(Base):
     __tablename__ = "project_members"
     __table_args__ = (
         UniqueConstraint("project_id", "user_id", name="uq_project_user"),
+        Index(
+            "ix_project_members_user_id_project_id",
+            "user_id",
+            "project_id",
+            postgresql_include=["role"],
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
@@ -48,7 +58,7 @@ class ProjectMember(Base):
         ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
     )
     user_id: Mapped[UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     role: Mapped[ProjectRole] = mapped_column(
         Enum(ProjectRole, values_callable=lambda obj: [e.value for e in obj]),
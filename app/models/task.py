@@ -1,7 +1,8 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Column, Computed, DateTime, Enum, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -13,10 +14,48 @@ from app.utils.uuid import uuid7
 
 class Task(Base):
     __tablename__ = "tasks"
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+    __table_args__ = (
+        Index(
+            "ix_tasks_project_id_live",
+            "project_id",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_project_id_status_priority_live",
+            "project_id",
+            "status",
+            "priority",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_project_id_due_date_live",
+            "project_id",
+            "due_date",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_project_id_assigned_to_live",
+            "project_id",
+            "assigned_to",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_assigned_to_status_due_date_live",
+            "assigned_to",
+            "status",
+            "due_date",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_tasks_project_id_updated_at", "project_id", "updated_at", "id"),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     project_id: Mapped[UUID] = mapped_column(
-        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -48,8 +87,21 @@ class Task(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Bumped by every UPDATE, like updated_at; guards conditional (If-Match) writes
+    version: Mapped[int] = mapped_column(
+        Integer, server_default=text("1"), onupdate=text("version + 1"), nullable=False
+    )
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Only used in WHERE/ORDER BY, so it is kept off the mapper and never loaded
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    )
 
     project: Mapped["Project"] = relationship("Project")
@@ -0,0 +1,16 @@
+from functools import lru_cache
+
+from pydantic import BaseModel, create_model
+
+
+@lru_cache(maxsize=256)
+def partial_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """Return a copy of ``model`` that only declares ``fields``.
+
+    Built once per distinct field set and reused for later requests.
+    """
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=model.model_config,
+        **{name: (info.annotation, info) for name, info in model.model_fields.items() if name in fields},
+    )
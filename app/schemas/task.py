@@ -1,8 +1,10 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from app.core.config import settings
 from app.enums import TaskPriority, TaskStatus
 
 
@@ -39,3 +41,135 @@ class TaskResponse(BaseModel):
     deleted_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskSearchHit(BaseModel):
+    task: TaskResponse
+    rank: float
+
+
+class TaskTombstone(BaseModel):
+    id: UUID
+    deleted_at: datetime
+
+
+class TaskChanges(BaseModel):
+    updated: list[TaskResponse]
+    deleted: list[TaskTombstone]
+    watermark: str | None
+    has_more: bool
+
+
+TaskSort = Literal[
+    "created_at", "-created_at",
+    "updated_at", "-updated_at",
+    "due_date", "-due_date",
+    "priority", "-priority",
+]
+
+
+class TaskFilter(BaseModel):
+    status: list[TaskStatus] | None = None
+    priority: list[TaskPriority] | None = None
+    assigned_to: UUID | None = None
+    unassigned: bool = False
+    due_after: datetime | None = None
+    due_before: datetime | None = None
+    created_since: datetime | None = None
+    updated_since: datetime | None = None
+
+    @model_validator(mode="after")
+    def check_assignee(self) -> "TaskFilter":
+        if self.unassigned and self.assigned_to is not None:
+            raise ValueError("assigned_to and unassigned are mutually exclusive")
+        return self
+
+    @property
+    def has_criteria(self) -> bool:
+        """Whether the filter narrows anything; empty status/priority lists do not."""
+        return bool(self.status or self.priority or self.unassigned) or any(
+            value is not None
+            for value in (self.assigned_to, self.due_after, self.due_before, self.created_since, self.updated_since)
+        )
+
+
+class TaskBulkCreate(BaseModel):
+    items: list[TaskCreate] = Field(min_length=1, max_length=settings.TASK_BULK_MAX_ITEMS)
+
+
+class TaskBulkPatchItem(BaseModel):
+    id: UUID
+    patch: TaskUpdate
+
+
+class TaskBulkUpdate(BaseModel):
+    """One of: ``ids`` + ``patch``, ``filter`` + ``patch``, or per-item ``items``."""
+
+    ids: list[UUID] | None = Field(default=None, min_length=1, max_length=settings.TASK_BULK_MAX_ITEMS)
+    filter: TaskFilter | None = None
+    patch: TaskUpdate | None = None
+    items: list[TaskBulkPatchItem] | None = Field(
+        default=None, min_length=1, max_length=settings.TASK_BULK_MAX_ITEMS
+    )
+
+    @model_validator(mode="after")
+    def check_target(self) -> "TaskBulkUpdate":
+        targets = [t for t in (self.ids, self.filter, self.items) if t is not None]
+        if len(targets) != 1:
+            raise ValueError("Provide exactly one of ids, filter or items")
+        if self.items is None and self.patch is None:
+            raise ValueError("patch is required with ids or filter")
+        if self.items is not None and self.patch is not None:
+            raise ValueError("patch cannot be combined with items")
+        # An empty filter would rewrite every live task in the project
+        if self.filter is not None and not self.filter.has_criteria:
+            raise ValueError("filter must set at least one criterion")
+        return self
+
+
+class TaskBulkSelection(BaseModel):
+    ids: list[UUID] | None = Field(default=None, min_length=1, max_length=settings.TASK_BULK_MAX_ITEMS)
+    filter: TaskFilter | None = None
+
+    @model_validator(mode="after")
+    def check_target(self) -> "TaskBulkSelection":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        # An empty filter would select every task in the project
+        if self.filter is not None and not self.filter.has_criteria:
+            raise ValueError("filter must set at least one criterion")
+        return self
+
+
+class TaskBulkCount(BaseModel):
+    affected: int
+
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    task: TaskResponse | None = None
+    error: str | None = None
+
+
+class TaskBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[TaskBulkItemResult]
+
+
+class TaskImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TaskImportReport(BaseModel):
+    id: UUID
+    project_id: UUID
+    status: Literal["running", "completed", "failed"] = "running"
+    rows_read: int = 0
+    rows_invalid: int = 0
+    rows_rejected: int = 0
+    rows_imported: int = 0
+    errors: list[TaskImportError] = []
+    started_at: datetime
+    finished_at: datetime | None = None
@@ -1,14 +1,29 @@
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, and_, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.core.cache import MISSING, create_cache_backend
+from app.core.config import settings
 from app.enums import ProjectRole
 from app.models.project import Project, ProjectMember
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.models.user import User
+from app.schemas.project import MemberResponse, ProjectCreate, ProjectResponse, ProjectUpdate
+from app.services import user as user_service
+from app.utils.etag import VersionConflictError
+
+membership_cache = create_cache_backend(
+    "membership",
+    maxsize=settings.MEMBERSHIP_CACHE_MAX_SIZE,
+    ttl=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+
+
+def _membership_key(project_id: UUID, user_id: UUID) -> str:
+    return f"{project_id}:{user_id}"
 
 
 async def get_project(db: AsyncSession, project_id: UUID) -> Optional[Project]:
@@ -18,54 +33,123 @@ async def get_project(db: AsyncSession, project_id: UUID) -> Optional[Project]:
     return result.scalar_one_or_none()
 
 
-async def get_user_projects(db: AsyncSession, user_id: UUID) -> list[Project]:
+async def get_cached_member_role(project_id: UUID, user_id: UUID) -> ProjectRole | None | object:
+    """Cached role, None for a cached non-member, or MISSING on a cache miss.
+
+    Roles are only cached for live projects, so a cached role implies the
+    project exists.
+    """
+    cached = await membership_cache.get(_membership_key(project_id, user_id))
+    if cached is None:
+        return MISSING
+    return ProjectRole(cached) if cached else None
+
+
+async def _cache_member_role(project_id: UUID, user_id: UUID, role: ProjectRole | None) -> None:
+    key = _membership_key(project_id, user_id)
+    if role is None:
+        await membership_cache.set(key, "", ttl=settings.MEMBERSHIP_CACHE_NEGATIVE_TTL_SECONDS)
+    else:
+        await membership_cache.set(key, role.value)
+
+
+async def get_project_context(
+    db: AsyncSession, project_id: UUID, user_id: UUID
+) -> tuple[Optional[User], Optional[ProjectRole], Optional[Project]]:
+    """User, role and live project in one round trip; refreshes the principal and role caches."""
     result = await db.execute(
-        select(Project)
+        select(User, ProjectMember.role, Project)
+        .select_from(User)
+        .outerjoin(
+            ProjectMember,
+            and_(ProjectMember.user_id == User.id, ProjectMember.project_id == project_id),
+        )
+        .outerjoin(
+            Project,
+            and_(Project.id == project_id, Project.deleted_at.is_(None)),
+        )
+        .where(User.id == user_id, User.deleted_at.is_(None))
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None, None, None
+
+    user, role, project = row
+    user_service.cache_principal(user)
+    await _cache_member_role(project_id, user_id, role if project is not None else None)
+    return user, role, project
+
+
+async def get_user_projects(
+    db: AsyncSession, user_id: UUID, fields: Sequence[str] | None = None
+) -> list[Row]:
+    """Rows of the ProjectResponse fields (or just ``fields``), in that order."""
+    names = ProjectResponse.model_fields if fields is None else fields
+    stmt = (
+        select(*(Project.__table__.c[name] for name in names))
         .join(ProjectMember)
         .where(ProjectMember.user_id == user_id, Project.deleted_at.is_(None))
-        .options(selectinload(Project.members))
     )
-    return list[Project](result.scalars().all())
+    result = await db.execute(stmt)
+    return list(result.all())
 
 
 async def create_project(
     db: AsyncSession, project_data: ProjectCreate, creator_id: UUID
 ) -> Project:
-    project = Project(
-        name=project_data.name,
-        description=project_data.description,
-        created_by=creator_id,
+    project = await db.scalar(
+        insert(Project)
+        .values(
+            name=project_data.name,
+            description=project_data.description,
+            created_by=creator_id,
+        )
+        .returning(Project)
     )
-    db.add(project)
-    await db.flush()
     
-    member = ProjectMember(
-        project_id=project.id,
-        user_id=creator_id,
-        role=ProjectRole.OWNER,
+    await db.execute(
+        insert(ProjectMember).values(
+            project_id=project.id,
+            user_id=creator_id,
+            role=ProjectRole.OWNER,
+        )
     )
-    db.add(member)
     
     await db.commit()
-    await db.refresh(project)
     return project
 
 
 async def update_project(
-    db: AsyncSession, project: Project, project_data: ProjectUpdate
+    db: AsyncSession,
+    project: Project,
+    project_data: ProjectUpdate,
+    expected_version: int | None = None,
 ) -> Project:
+    if expected_version is not None and project.version != expected_version:
+        raise VersionConflictError()
+
     update_data = project_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    
+    if not update_data:
+        return project
+
+    stmt = update(Project).where(Project.id == project.id)
+    if expected_version is not None:
+        stmt = stmt.where(Project.version == expected_version)
+    updated = await db.scalar(
+        stmt.values(**update_data)
+        .returning(Project)
+        .execution_options(populate_existing=True)
+    )
+    if updated is None:
+        raise VersionConflictError()
     await db.commit()
-    await db.refresh(project)
-    return project
+    return updated
 
 
 async def delete_project(db: AsyncSession, project: Project) -> None:
     project.deleted_at = datetime.now()
     await db.commit()
+    await membership_cache.delete_prefix(f"{project.id}:")
 
 
 async def get_membership(
@@ -81,32 +165,76 @@ async def get_membership(
     return result.scalar_one_or_none()
 
 
+async def get_member_ids(
+    db: AsyncSession, project_id: UUID, user_ids: set[UUID]
+) -> set[UUID]:
+    """Return the subset of ``user_ids`` that are members of the project."""
+    if not user_ids:
+        return set()
+    result = await db.scalars(
+        select(ProjectMember.user_id).where(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id.in_(user_ids),
+        )
+    )
+    return set(result.all())
+
+
+async def get_member_role(
+    db: AsyncSession, project_id: UUID, user_id: UUID
+) -> Optional[ProjectRole]:
+    cached = await get_cached_member_role(project_id, user_id)
+    if cached is not MISSING:
+        return cached
+
+    role = await db.scalar(
+        select(ProjectMember.role)
+        .join(Project, and_(Project.id == ProjectMember.project_id, Project.deleted_at.is_(None)))
+        .where(
+            ProjectMember.user_id == user_id,
+            ProjectMember.project_id == project_id,
+        )
+    )
+    await _cache_member_role(project_id, user_id, role)
+    return role
+
+
 async def add_member(
     db: AsyncSession, project_id: UUID, user_id: UUID, role: ProjectRole
 ) -> ProjectMember:
-    member = ProjectMember(
-        project_id=project_id,
-        user_id=user_id,
-        role=role,
+    member = await db.scalar(
+        insert(ProjectMember)
+        .values(
+            project_id=project_id,
+            user_id=user_id,
+            role=role,
+        )
+        .returning(ProjectMember)
     )
-    db.add(member)
     await db.commit()
-    await db.refresh(member)
+    await membership_cache.delete(_membership_key(project_id, user_id))
     return member
 
 
 async def update_member_role(
     db: AsyncSession, member: ProjectMember, role: ProjectRole
 ) -> ProjectMember:
-    member.role = role
+    member = await db.scalar(
+        update(ProjectMember)
+        .where(ProjectMember.id == member.id)
+        .values(role=role)
+        .returning(ProjectMember)
+        .execution_options(populate_existing=True)
+    )
     await db.commit()
-    await db.refresh(member)
+    await membership_cache.delete(_membership_key(member.project_id, member.user_id))
     return member
 
 
 async def remove_member(db: AsyncSession, member: ProjectMember) -> None:
     await db.delete(member)
     await db.commit()
+    await membership_cache.delete(_membership_key(member.project_id, member.user_id))
 
 
 async def get_project_members(
@@ -116,3 +244,12 @@ async def get_project_members(
         select(ProjectMember).where(ProjectMember.project_id == project_id)
     )
     return list(result.scalars().all())
+
+
+async def get_project_member_rows(db: AsyncSession, project_id: UUID) -> list[Row]:
+    """Rows of the MemberResponse fields, in that order."""
+    result = await db.execute(
+        select(*(ProjectMember.__table__.c[name] for name in MemberResponse.model_fields))
+        .where(ProjectMember.project_id == project_id)
+    )
+    return list(result.all())
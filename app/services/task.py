@@ -1,54 +1,532 @@
-from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, Select, and_, func, insert, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.enums import TaskPriority
+from app.models.project import Project, ProjectMember
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskCreate, TaskFilter, TaskResponse, TaskSort, TaskUpdate
+from app.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.etag import VersionConflictError
 
 
-async def get_task(db: AsyncSession, task_id: UUID) -> Task | None:
-    result = await db.execute(
-        select(Task).where(Task.id == task_id, Task.deleted_at.is_(None))
-    )
+def _load_only(fields: Sequence[str]):
+    return load_only(*(getattr(Task, name) for name in fields))
+
+
+async def get_task(
+    db: AsyncSession, task_id: UUID, fields: Sequence[str] | None = None
+) -> Task | None:
+    stmt = select(Task).where(Task.id == task_id, Task.deleted_at.is_(None))
+    if fields is not None:
+        stmt = stmt.options(_load_only({*fields, "id", "project_id", "version"}))
+    result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
-async def get_project_tasks(db: AsyncSession, project_id: UUID) -> list[Task]:
+# Every column the API exposes, i.e. all but the generated search_vector
+_RETURNED_COLUMNS = [column for column in Task.__table__.c if column.key != "search_vector"]
+
+async def get_task_version(
+    db: AsyncSession, project_id: UUID, task_id: UUID
+) -> int | None:
+    return await db.scalar(
+        select(Task.version).where(
+            Task.id == task_id,
+            Task.project_id == project_id,
+            Task.deleted_at.is_(None),
+        )
+    )
+
+
+async def get_project_tasks_state(
+    db: AsyncSession, project_id: UUID
+) -> tuple[int, int | None, datetime | None, datetime | None]:
+    """Cheap fingerprint of a project's tasks: row count, version sum and latest change times.
+
+    Counts soft-deleted rows too, so deletes and restores change it. Every
+    UPDATE bumps a version, so the sum catches writes whose now()-based
+    updated_at is older than the latest one already seen.
+    """
     result = await db.execute(
-        select(Task).where(Task.project_id == project_id, Task.deleted_at.is_(None))
+        select(
+            func.count(), func.sum(Task.version), func.max(Task.updated_at), func.max(Task.deleted_at)
+        ).where(Task.project_id == project_id)
+    )
+    count, versions, updated_at, deleted_at = result.one()
+    return count, versions, updated_at, deleted_at
+
+
+_SORT_COLUMNS = {
+    # uuid7 ids are time-ordered, so creation order is id order
+    "created_at": Task.id,
+    "updated_at": Task.updated_at,
+    "due_date": Task.due_date,
+    "priority": Task.priority,
+}
+
+
+def task_filter_conditions(filters: TaskFilter) -> list[ColumnElement[bool]]:
+    conditions = []
+    if filters.status:
+        conditions.append(Task.status.in_(filters.status))
+    if filters.priority:
+        conditions.append(Task.priority.in_(filters.priority))
+    if filters.assigned_to is not None:
+        conditions.append(Task.assigned_to == filters.assigned_to)
+    if filters.unassigned:
+        conditions.append(Task.assigned_to.is_(None))
+    if filters.due_after is not None:
+        conditions.append(Task.due_date >= filters.due_after)
+    if filters.due_before is not None:
+        conditions.append(Task.due_date < filters.due_before)
+    if filters.created_since is not None:
+        conditions.append(Task.created_at >= filters.created_since)
+    if filters.updated_since is not None:
+        conditions.append(Task.updated_at >= filters.updated_since)
+    return conditions
+
+
+def _sort_key(task: Task | Row, field: str) -> Any:
+    value = getattr(task, field)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, TaskPriority):
+        return value.value
+    return value
+
+
+def _parse_sort_value(field: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if field == "priority":
+        return TaskPriority(value)
+    return datetime.fromisoformat(value)
+
+
+def _keyset_condition(column, descending: bool, value: Any, last_id: UUID) -> ColumnElement[bool]:
+    # Postgres default null ordering: NULLS LAST ascending, NULLS FIRST descending
+    if column is Task.id:
+        return Task.id < last_id if descending else Task.id > last_id
+
+    if descending:
+        if value is None:
+            return or_(and_(column.is_(None), Task.id < last_id), column.is_not(None))
+        return tuple_(column, Task.id) < tuple_(value, last_id)
+
+    if value is None:
+        return and_(column.is_(None), Task.id > last_id)
+    condition = tuple_(column, Task.id) > tuple_(value, last_id)
+    if column.nullable:
+        condition = or_(condition, column.is_(None))
+    return condition
+
+
+async def paginate_tasks(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    sort: TaskSort,
+    limit: int,
+    cursor: str | None,
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row], str | None]:
+    """Run ``stmt`` as one keyset page of plain rows.
+
+    Each row holds the TaskResponse fields (or just ``fields``) first and in
+    that order, followed by any keyset column the selection left out.
+    """
+    descending = sort.startswith("-")
+    field = sort.lstrip("-")
+    column = _SORT_COLUMNS[field]
+
+    if cursor is not None:
+        try:
+            values = decode_cursor(cursor)
+            last_id = UUID(values["id"])
+            if values.get("sort", "created_at") != sort:
+                raise InvalidCursorError("Cursor does not match sort order")
+            value = _parse_sort_value(field, values.get("value")) if column is not Task.id else None
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        stmt = stmt.where(_keyset_condition(column, descending, value, last_id))
+
+    order_by = [column.desc(), Task.id.desc()] if descending else [column.asc(), Task.id.asc()]
+    if column is Task.id:
+        order_by = order_by[:1]
+    names = list(TaskResponse.model_fields if fields is None else fields)
+    names += [name for name in ("id", column.key) if name not in names]
+    stmt = stmt.with_only_columns(*(Task.__table__.c[name] for name in names), maintain_column_froms=True)
+
+    result = await db.execute(stmt.order_by(*order_by).limit(limit + 1))
+    tasks = list(result.all())
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        values = {"id": str(last.id)}
+        if sort != "created_at":
+            values["sort"] = sort
+        if column is not Task.id:
+            values["value"] = _sort_key(last, field)
+        next_cursor = encode_cursor(values)
+    return tasks, next_cursor
+
+
+async def get_project_tasks(
+    db: AsyncSession,
+    project_id: UUID,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    filters: TaskFilter | None = None,
+    sort: TaskSort = "created_at",
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row], str | None]:
+    stmt = select(Task).where(Task.project_id == project_id, Task.deleted_at.is_(None))
+    if filters is not None:
+        stmt = stmt.where(*task_filter_conditions(filters))
+    return await paginate_tasks(db, stmt, sort=sort, limit=limit, cursor=cursor, fields=fields)
+
+
+async def get_task_changes(
+    db: AsyncSession,
+    project_id: UUID,
+    *,
+    since: str | None,
+    limit: int,
+    settle_seconds: float,
+) -> tuple[list[Task], str | None, bool]:
+    """Tasks of the project changed after the ``since`` watermark, oldest first.
+
+    Soft-deleted tasks are included (their deletes bump ``updated_at``).
+    Returns the rows, the watermark to resume from and whether more remain.
+    """
+    stmt = select(Task).where(
+        Task.project_id == project_id,
+        Task.updated_at <= func.now() - timedelta(seconds=settle_seconds),
+    )
+    if since is not None:
+        try:
+            values = decode_cursor(since)
+            last_updated_at = datetime.fromisoformat(values["updated_at"])
+            last_id = UUID(values["id"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidCursorError("Invalid watermark") from e
+        stmt = stmt.where(tuple_(Task.updated_at, Task.id) > tuple_(last_updated_at, last_id))
+
+    result = await db.execute(stmt.order_by(Task.updated_at, Task.id).limit(limit + 1))
+    tasks = list(result.scalars().all())
+
+    has_more = len(tasks) > limit
+    tasks = tasks[:limit]
+    watermark = since
+    if tasks:
+        last = tasks[-1]
+        watermark = encode_cursor({"updated_at": last.updated_at.isoformat(), "id": str(last.id)})
+    return tasks, watermark, has_more
+
+
+async def stream_project_tasks(
+    db: AsyncSession,
+    project_id: UUID,
+    *,
+    filters: TaskFilter | None = None,
+    batch_size: int,
+) -> AsyncIterator[Sequence[Row]]:
+    """Yield the project's live tasks as plain rows, ``batch_size`` at a time.
+
+    Uses a server-side cursor, so memory stays bounded by one batch.
+    """
+    stmt = (
+        select(*_RETURNED_COLUMNS)
+        .where(Task.project_id == project_id, Task.deleted_at.is_(None))
+        .order_by(Task.id)
+        .execution_options(yield_per=batch_size)
+    )
+    if filters is not None:
+        stmt = stmt.where(*task_filter_conditions(filters))
+
+    result = await db.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
+
+def _member_project_ids(user_id: UUID) -> Select:
+    return (
+        select(ProjectMember.project_id)
+        .join(Project, Project.id == ProjectMember.project_id)
+        .where(ProjectMember.user_id == user_id, Project.deleted_at.is_(None))
+    )
+
+
+async def search_tasks(
+    db: AsyncSession,
+    query: str,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    project_id: UUID | None = None,
+    member_id: UUID | None = None,
+) -> tuple[list[tuple[Task, float]], str | None]:
+    """Rank live tasks against a web-search style query, best match first.
+
+    Scope with ``project_id``, ``member_id`` (every project the user belongs
+    to, resolved in the same statement), or both.
+    """
+    search_vector = Task.__table__.c.search_vector
+    tsquery = func.websearch_to_tsquery("english", query)
+    rank = func.ts_rank_cd(search_vector, tsquery).label("rank")
+
+    stmt = select(Task, rank).where(search_vector.op("@@")(tsquery), Task.deleted_at.is_(None))
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    if member_id is not None:
+        stmt = stmt.where(Task.project_id.in_(_member_project_ids(member_id)))
+
+    if cursor is not None:
+        try:
+            values = decode_cursor(cursor)
+            last_id = UUID(values["id"])
+            last_rank = float(values["rank"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        stmt = stmt.where(tuple_(rank, Task.id) < tuple_(last_rank, last_id))
+
+    result = await db.execute(stmt.order_by(rank.desc(), Task.id.desc()).limit(limit + 1))
+    hits = [(task, score) for task, score in result.all()]
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        last, last_rank = hits[-1]
+        next_cursor = encode_cursor({"id": str(last.id), "rank": last_rank})
+    return hits, next_cursor
+
+
+async def get_assigned_tasks(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    filters: TaskFilter | None = None,
+    sort: TaskSort = "created_at",
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row], str | None]:
+    stmt = select(Task).where(
+        Task.assigned_to == user_id,
+        Task.deleted_at.is_(None),
+        Task.project_id.in_(_member_project_ids(user_id)),
     )
-    return list(result.scalars().all())
+    if filters is not None:
+        stmt = stmt.where(*task_filter_conditions(filters))
+    return await paginate_tasks(db, stmt, sort=sort, limit=limit, cursor=cursor, fields=fields)
 
 
 async def create_task(
     db: AsyncSession, project_id: UUID, task_data: TaskCreate, creator_id: UUID
 ) -> Task:
-    task = Task(
-        project_id=project_id,
-        title=task_data.title,
-        description=task_data.description,
-        status=task_data.status,
-        priority=task_data.priority,
-        assigned_to=task_data.assigned_to,
-        due_date=task_data.due_date,
-        created_by=creator_id,
-    )
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
+    task = await db.scalar(
+        insert(Task)
+        .values(
+            project_id=project_id,
+            title=task_data.title,
+            description=task_data.description,
+            status=task_data.status,
+            priority=task_data.priority,
+            assigned_to=task_data.assigned_to,
+            due_date=task_data.due_date,
+            created_by=creator_id,
+        )
+        .returning(Task)
+    )
+    await db.commit()
     return task
 
 
-async def update_task(db: AsyncSession, task: Task, task_data: TaskUpdate) -> Task:
+async def create_tasks(
+    db: AsyncSession, project_id: UUID, items: list[TaskCreate], creator_id: UUID
+) -> list[Task]:
+    """Insert ``items`` with one multi-row INSERT and commit once.
+
+    Returns the new tasks in the same order as ``items``.
+    """
+    if not items:
+        return []
+
+    result = await db.execute(
+        insert(Task).returning(*_RETURNED_COLUMNS, sort_by_parameter_order=True),
+        [
+            {
+                **item.model_dump(),
+                "project_id": project_id,
+                "created_by": creator_id,
+            }
+            for item in items
+        ],
+    )
+    tasks = [Task(**row._mapping) for row in result.all()]
+    await db.commit()
+    return tasks
+
+
+async def update_task(
+    db: AsyncSession,
+    task: Task,
+    task_data: TaskUpdate,
+    expected_version: int | None = None,
+) -> Task:
+    """Apply ``task_data``; with ``expected_version`` only if the row is still at it.
+
+    Raises VersionConflictError when the row has moved on.
+    """
+    if expected_version is not None and task.version != expected_version:
+        raise VersionConflictError()
+
     update_data = task_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    if not update_data:
+        return task
 
+    stmt = update(Task).where(Task.id == task.id)
+    if expected_version is not None:
+        stmt = stmt.where(Task.version == expected_version)
+    updated = await db.scalar(
+        stmt.values(**update_data)
+        .returning(Task)
+        .execution_options(populate_existing=True)
+    )
+    if updated is None:
+        raise VersionConflictError()
     await db.commit()
-    await db.refresh(task)
-    return task
+    return updated
+
+
+class TooManyTasksError(ValueError):
+    pass
+
+
+async def update_tasks(
+    db: AsyncSession, project_id: UUID, groups: list[tuple[list[UUID], dict[str, Any]]]
+) -> dict[UUID, Task]:
+    """Apply each ``(task_ids, values)`` group as one UPDATE and commit once.
+
+    Only live tasks of the project are touched; returns the updated rows by id.
+    """
+    updated = {}
+    for task_ids, values in groups:
+        result = await db.execute(
+            update(Task)
+            .where(
+                Task.project_id == project_id,
+                Task.deleted_at.is_(None),
+                Task.id.in_(task_ids),
+            )
+            .values(**values)
+            .returning(*_RETURNED_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        for row in result.all():
+            updated[row.id] = Task(**row._mapping)
+    await db.commit()
+    return updated
+
+
+async def update_matching_tasks(
+    db: AsyncSession,
+    project_id: UUID,
+    filters: TaskFilter,
+    values: dict[str, Any],
+    *,
+    max_rows: int,
+) -> list[Task]:
+    """Apply ``values`` to every live project task matching ``filters``.
+
+    Raises TooManyTasksError, without changing anything, when more than
+    ``max_rows`` tasks match.
+    """
+    targets = (
+        select(Task.id)
+        .where(
+            Task.project_id == project_id,
+            Task.deleted_at.is_(None),
+            *task_filter_conditions(filters),
+        )
+        .limit(max_rows + 1)
+    )
+    result = await db.execute(
+        update(Task)
+        .where(Task.id.in_(targets))
+        .values(**values)
+        .returning(*_RETURNED_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    if len(rows) > max_rows:
+        await db.rollback()
+        raise TooManyTasksError(f"Filter matches more than {max_rows} tasks")
+
+    await db.commit()
+    return [Task(**row._mapping) for row in rows]
+
+
+def _selection_conditions(
+    ids: list[UUID] | None, filters: TaskFilter | None
+) -> list[ColumnElement[bool]]:
+    conditions = []
+    if ids is not None:
+        conditions.append(Task.id.in_(ids))
+    if filters is not None:
+        conditions.extend(task_filter_conditions(filters))
+    return conditions
+
+
+async def soft_delete_tasks(
+    db: AsyncSession,
+    project_id: UUID,
+    *,
+    ids: list[UUID] | None = None,
+    filters: TaskFilter | None = None,
+) -> int:
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.project_id == project_id,
+            Task.deleted_at.is_(None),
+            *_selection_conditions(ids, filters),
+        )
+        .values(deleted_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def restore_tasks(
+    db: AsyncSession,
+    project_id: UUID,
+    *,
+    ids: list[UUID] | None = None,
+    filters: TaskFilter | None = None,
+) -> int:
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.project_id == project_id,
+            Task.deleted_at.is_not(None),
+            *_selection_conditions(ids, filters),
+        )
+        .values(deleted_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
 
 
 async def delete_task(db: AsyncSession, task: Task) -> None:
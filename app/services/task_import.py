@@ -0,0 +1,211 @@
+import tempfile
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timezone
+from typing import IO, Any
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+from app.schemas.task import TaskCreate, TaskImportError, TaskImportReport
+from app.utils.imports import RecordError
+from app.utils.uuid import uuid7
+
+# Shared between workers with CACHE_BACKEND=redis, so any of them can report progress
+import_reports = create_cache_backend(
+    "task_imports",
+    maxsize=1000,
+    ttl=settings.TASK_IMPORT_REPORT_TTL_SECONDS,
+)
+
+_STAGING_TABLE = "task_import_staging"
+_STAGING_COLUMNS = ["line", "id", "title", "description", "status", "priority", "assigned_to", "due_date"]
+
+# Validated rows are spooled here (then to disk) until the upload has been read
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+_CREATE_STAGING = text(
+    f"""
+    CREATE TEMP TABLE {_STAGING_TABLE} (
+        line integer NOT NULL,
+        id uuid NOT NULL,
+        title varchar(255) NOT NULL,
+        description text,
+        status taskstatus NOT NULL,
+        priority taskpriority NOT NULL,
+        assigned_to uuid,
+        due_date timestamptz
+    ) ON COMMIT DROP
+    """
+)
+
+# Drops rows assigned to non-members, reporting how many and the first few lines
+_REJECT_NON_MEMBERS = text(
+    f"""
+    WITH rejected AS (
+        DELETE FROM {_STAGING_TABLE} s
+        WHERE s.assigned_to IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM project_members m
+              WHERE m.project_id = :project_id AND m.user_id = s.assigned_to
+          )
+        RETURNING s.line
+    )
+    SELECT count(*), coalesce((array_agg(line ORDER BY line))[1:(:max_errors)], '{{}}')
+    FROM rejected
+    """
+)
+
+# now() would stamp the tasks with the transaction's start; clock_timestamp()
+# keeps them close to the commit so /changes watermarks cannot skip them
+_MERGE = text(
+    f"""
+    INSERT INTO tasks (
+        id, project_id, title, description, status, priority, assigned_to, created_by, due_date, created_at, updated_at
+    )
+    SELECT id, :project_id, title, description, status, priority, assigned_to, :created_by, due_date, merged_at, merged_at
+    FROM {_STAGING_TABLE} CROSS JOIN (SELECT clock_timestamp() AS merged_at) AS clock
+    ORDER BY line
+    """
+)
+
+
+def _report_key(project_id: UUID, import_id: UUID) -> str:
+    return f"{project_id}:{import_id}"
+
+
+async def save_import(report: TaskImportReport) -> None:
+    await import_reports.set(_report_key(report.project_id, report.id), report.model_dump_json())
+
+
+async def start_import(project_id: UUID) -> TaskImportReport:
+    report = TaskImportReport(id=uuid4(), project_id=project_id, started_at=datetime.now(timezone.utc))
+    await save_import(report)
+    return report
+
+
+async def get_import(project_id: UUID, import_id: UUID) -> TaskImportReport | None:
+    cached = await import_reports.get(_report_key(project_id, import_id))
+    if cached is None:
+        return None
+    return TaskImportReport.model_validate_json(cached)
+
+
+async def list_imports(project_id: UUID) -> list[TaskImportReport]:
+    cached = await import_reports.get_prefix(f"{project_id}:")
+    reports = [TaskImportReport.model_validate_json(value) for value in cached.values()]
+    return sorted(reports, key=lambda report: report.started_at, reverse=True)
+
+
+def _record_error(report: TaskImportReport, line: int, error: str) -> None:
+    if len(report.errors) < settings.TASK_IMPORT_MAX_ERRORS:
+        report.errors.append(TaskImportError(line=line, error=error))
+
+
+def _validation_message(e: ValidationError) -> str:
+    error = e.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+
+
+def _spool_rows(spool: IO[bytes], rows: Sequence[tuple]) -> None:
+    """Append ``rows`` to ``spool`` in COPY's text format."""
+    spool.write(
+        "".join("\t".join(_copy_value(value) for value in row) + "\n" for row in rows).encode()
+    )
+
+
+async def import_tasks(
+    db: AsyncSession,
+    report: TaskImportReport,
+    records: AsyncIterator[tuple[int, dict[str, Any] | RecordError]],
+    creator_id: UUID,
+    *,
+    batch_size: int,
+) -> TaskImportReport:
+    """Validate ``records`` as TaskCreate and load them into the report's project.
+
+    The upload is read without holding a connection: valid rows are spooled
+    in batches of ``batch_size``. One short transaction then COPYs them into
+    a temporary staging table, drops rows assigned to non-members and merges
+    the rest into ``tasks``. ``report`` is updated as rows arrive and saved
+    after every batch, so it doubles as the progress record.
+    """
+    # Ends the transaction the permission checks opened on this session
+    await db.commit()
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spool:
+        try:
+            batch = []
+            async for line, record in records:
+                report.rows_read += 1
+                if isinstance(record, RecordError):
+                    report.rows_invalid += 1
+                    _record_error(report, line, str(record))
+                    continue
+                try:
+                    item = TaskCreate.model_validate(record)
+                except ValidationError as e:
+                    report.rows_invalid += 1
+                    _record_error(report, line, _validation_message(e))
+                    continue
+
+                batch.append((
+                    line,
+                    uuid7(),
+                    item.title,
+                    item.description,
+                    item.status.value,
+                    item.priority.value,
+                    item.assigned_to,
+                    item.due_date.isoformat() if item.due_date else None,
+                ))
+                if len(batch) >= batch_size:
+                    _spool_rows(spool, batch)
+                    batch = []
+                    await save_import(report)
+            _spool_rows(spool, batch)
+            spool.seek(0)
+
+            await db.execute(_CREATE_STAGING)
+            connection = await db.connection()
+            raw = (await connection.get_raw_connection()).driver_connection
+            await raw.copy_to_table(_STAGING_TABLE, source=spool, columns=_STAGING_COLUMNS)
+
+            rejected, rejected_lines = (
+                await db.execute(
+                    _REJECT_NON_MEMBERS,
+                    {"project_id": report.project_id, "max_errors": settings.TASK_IMPORT_MAX_ERRORS},
+                )
+            ).one()
+            report.rows_rejected = rejected
+            for line in rejected_lines:
+                _record_error(report, line, "Assigned user is not a project member")
+
+            result = await db.execute(_MERGE, {"project_id": report.project_id, "created_by": creator_id})
+            await db.commit()
+            report.rows_imported = result.rowcount
+            report.status = "completed"
+        except Exception:
+            report.status = "failed"
+            await db.rollback()
+            raise
+        finally:
+            report.finished_at = datetime.now(timezone.utc)
+            await save_import(report)
+    return report
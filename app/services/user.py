@@ -2,13 +2,21 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.core.security import hash_password
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.hashing import password_hasher
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
 
 async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     result = await db.execute(
@@ -17,6 +25,39 @@ async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     return result.scalar_one_or_none()
 
 
+def _snapshot(user: User) -> dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def cached_principal(user_id: UUID) -> Optional[User]:
+    """Detached principal from the cache, or None on a miss; never touches a session."""
+    snapshot = principal_cache.get(user_id, None)
+    if snapshot is None:
+        return None
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def cache_principal(user: User) -> None:
+    principal_cache.set(user.id, _snapshot(user))
+
+
+async def get_principal(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    user = cached_principal(user_id)
+    if user is not None:
+        return await db.merge(user, load=False)
+
+    user = await get_user_by_id(db, user_id)
+    if user is not None:
+        cache_principal(user)
+    return user
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    principal_cache.delete(user_id)
+
+
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     result = await db.execute(
         select(User).where(User.email == email, User.deleted_at.is_(None))
@@ -32,15 +73,17 @@ async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User
 
 
 async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
-    user = User(
-        email=user_create.email,
-        username=user_create.username,
-        hashed_password=hash_password(user_create.password) 
-            if user_create.password else None,
+    user = await db.scalar(
+        insert(User)
+        .values(
+            email=user_create.email,
+            username=user_create.username,
+            hashed_password=await password_hasher.hash(user_create.password) 
+                if user_create.password else None,
+        )
+        .returning(User)
     )
-    db.add(user)
     await db.commit()
-    await db.refresh(user)
     return user
 
 
@@ -49,13 +92,20 @@ async def update_user(db: AsyncSession, user: User, user_update: UserUpdate) ->
     
     if "password" in update_data:
         password = update_data.pop("password")
-        update_data["hashed_password"] = hash_password(password) if password else None
+        update_data["hashed_password"] = await password_hasher.hash(password) if password else None
     
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    if not update_data:
+        return user
     
+    user = await db.scalar(
+        update(User)
+        .where(User.id == user.id)
+        .values(**update_data)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
     await db.commit()
-    await db.refresh(user)
+    invalidate_principal(user.id)
     return user
 
 
@@ -63,3 +113,4 @@ async def delete_user(db: AsyncSession, user: User) -> None:
     user.is_active = False
     user.deleted_at = datetime.now()
     await db.commit()
+    invalidate_principal(user.id)
@@ -0,0 +1,48 @@
+import hashlib
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+
+class VersionConflictError(Exception):
+    """A conditional write found the row at a different version."""
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over ``parts``; equal parts always give the same tag."""
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate If-None-Match against ``etag`` (weak comparison, RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def resource_etag(resource_id: UUID, version: int, fields: Sequence[str] | None = None) -> str:
+    """Strong ETag for one row; the version stays readable for If-Match."""
+    if fields is None:
+        return f'"{resource_id}.{version}"'
+    digest = hashlib.blake2b(",".join(fields).encode(), digest_size=6).hexdigest()
+    return f'"{resource_id}.{version}.{digest}"'
+
+
+def if_match_version(if_match: str, resource_id: UUID) -> int | None:
+    """Version the client expects from an If-Match header.
+
+    Any representation's ETag (full or sparse) names the same version.
+    Returns None when no tag belongs to ``resource_id``.
+    """
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            # Weak tags never match in If-Match (RFC 9110 13.1.1)
+            continue
+        parts = tag.strip('"').split(".")
+        if len(parts) >= 2 and parts[0] == str(resource_id) and parts[1].isdigit():
+            return int(parts[1])
+    return None
@@ -0,0 +1,64 @@
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class NdjsonEncoder:
+    """Serializes batches of rows as newline-delimited JSON."""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Iterable[Any]) -> bytes:
+        return b"".join(
+            self.model.model_validate(row).model_dump_json().encode() + b"\n" for row in rows
+        )
+
+
+class CsvEncoder:
+    """Serializes batches of rows as CSV, one column per model field."""
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+        self.fields = list(model.model_fields)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _flush(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writerow(self.fields)
+        return self._flush()
+
+    def encode(self, rows: Iterable[Any]) -> bytes:
+        for row in rows:
+            values = self.model.model_validate(row).model_dump(mode="json")
+            self._writer.writerow([values[name] for name in self.fields])
+        return self._flush()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream into a single gzip member, flushing per chunk."""
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,84 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+
+class RecordError(ValueError):
+    pass
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a streamed UTF-8 body into lines without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def read_ndjson_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, dict[str, Any] | RecordError]]:
+    """Yield ``(line_number, record)`` per non-blank line; bad lines yield a RecordError."""
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, RecordError("Invalid JSON")
+            continue
+        if not isinstance(record, dict):
+            yield line_number, RecordError("Expected a JSON object")
+            continue
+        yield line_number, record
+
+
+async def read_csv_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, dict[str, Any] | RecordError]]:
+    """Yield ``(line_number, record)`` per CSV row, keyed by the header row.
+
+    Quoted fields may span lines. Empty cells are left out of the record so
+    optional fields fall back to their defaults.
+    """
+    header: list[str] | None = None
+    line_number = 0
+    record_start = 0
+    pending: list[str] = []
+    quotes = 0
+
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not pending:
+            record_start = line_number
+        pending.append(line)
+        # RFC 4180 escapes quotes by doubling them, so an odd running count
+        # means a quoted field continues on the next line
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+
+        text, pending, quotes = "\n".join(pending), [], 0
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield record_start, RecordError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield record_start, {name: value for name, value in zip(header, values, strict=True) if value != ""}
+
+    if pending:
+        yield record_start, RecordError("Unterminated quoted field")
@@ -0,0 +1,18 @@
+import os
+
+# Enough configuration for app.core.config to load without a .env file
+_PLACEHOLDER_SETTINGS = {
+    "ACCESS_TOKEN_SECRET_KEY": "benchmark-secret-key-with-32-bytes!",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "5",
+    "POSTGRES_USER": "u",
+    "POSTGRES_PASSWORD": "p",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "bench",
+}
+
+
+def use_placeholder_settings() -> None:
+    """Fill in any settings the environment leaves unset; call before importing app."""
+    for name, value in _PLACEHOLDER_SETTINGS.items():
+        os.environ.setdefault(name, value)
@@ -0,0 +1,81 @@
+"""Task creation throughput: one request per task vs. the bulk endpoint's insert.
+
+Needs a database migrated to alembic head:
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_bulk_create
+"""
+import asyncio
+import os
+import sys
+import time
+
+from benchmarks._env import use_placeholder_settings
+
+use_placeholder_settings()
+
+from uuid import uuid4  # noqa: E402
+
+from sqlalchemy import delete, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.enums import ProjectRole  # noqa: E402
+from app.models.project import Project, ProjectMember  # noqa: E402
+from app.models.task import Task  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.task import TaskCreate  # noqa: E402
+from app.services import project as project_service  # noqa: E402
+from app.services import task as task_service  # noqa: E402
+
+TASKS = 500
+
+
+async def main(url: str) -> None:
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    items = [TaskCreate(title=f"Task {i}", description="Imported from sprint planning") for i in range(TASKS)]
+
+    async with sessions() as db:
+        user = await db.scalar(
+            insert(User)
+            .values(email=f"bench-{uuid4()}@example.com", username=f"bench-{uuid4().hex[:12]}")
+            .returning(User)
+        )
+        project = await db.scalar(insert(Project).values(name="bench", created_by=user.id).returning(Project))
+        await db.execute(
+            insert(ProjectMember).values(project_id=project.id, user_id=user.id, role=ProjectRole.OWNER)
+        )
+        await db.commit()
+
+    try:
+        # What N POST /tasks calls cost in the database: a membership check,
+        # an INSERT and a commit each
+        started = time.perf_counter()
+        for item in items:
+            async with sessions() as db:
+                await project_service.get_member_ids(db, project.id, {user.id})
+                await task_service.create_task(db, project.id, item, user.id)
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        async with sessions() as db:
+            await project_service.get_member_ids(db, project.id, {user.id})
+            await task_service.create_tasks(db, project.id, items, user.id)
+        bulk = time.perf_counter() - started
+    finally:
+        async with sessions() as db:
+            await db.execute(delete(Task).where(Task.project_id == project.id))
+            await db.execute(delete(Project).where(Project.id == project.id))
+            await db.execute(delete(User).where(User.id == user.id))
+            await db.commit()
+        await engine.dispose()
+
+    print(f"single-item path: {TASKS / single:10.0f} tasks/s ({single * 1e3:.0f} ms)")
+    print(f"bulk insert:      {TASKS / bulk:10.0f} tasks/s ({bulk * 1e3:.0f} ms)")
+    print(f"speedup:          {single / bulk:10.1f}x")
+
+
+if __name__ == "__main__":
+    database_url = os.environ.get("BENCH_DATABASE_URL")
+    if not database_url:
+        sys.exit("Set BENCH_DATABASE_URL to a migrated database")
+    asyncio.run(main(database_url))
@@ -0,0 +1,37 @@
+"""Per-request JWT verification cost with and without the verified-token cache.
+
+Run with: python -m benchmarks.bench_decode_token
+"""
+import timeit
+
+from benchmarks._env import use_placeholder_settings
+
+use_placeholder_settings()
+
+from uuid import uuid4  # noqa: E402
+
+import jwt  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import create_access_token, decode_token  # noqa: E402
+
+ITERATIONS = 50_000
+
+
+def main() -> None:
+    token = create_access_token(uuid4())
+
+    uncached = timeit.timeit(
+        lambda: jwt.decode(token, settings.ACCESS_TOKEN_SECRET_KEY, algorithms=[settings.ALGORITHM]),
+        number=ITERATIONS,
+    )
+    decode_token(token)
+    cached = timeit.timeit(lambda: decode_token(token), number=ITERATIONS)
+
+    print(f"jwt.decode:          {uncached / ITERATIONS * 1e6:8.2f} us/request")
+    print(f"decode_token cached: {cached / ITERATIONS * 1e6:8.2f} us/request")
+    print(f"speedup:             {uncached / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
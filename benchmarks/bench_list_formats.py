@@ -0,0 +1,68 @@
+"""Task list payload size and encode time: JSON vs. columnar JSON vs. msgpack.
+
+Run with: python -m benchmarks.bench_list_formats
+"""
+import gzip
+import time
+
+from benchmarks._env import use_placeholder_settings
+
+use_placeholder_settings()
+
+from datetime import datetime, timezone  # noqa: E402
+from uuid import uuid4  # noqa: E402
+
+from app.api.responses import (  # noqa: E402
+    COLUMNAR_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    page_response,
+)
+from app.enums import TaskPriority, TaskStatus  # noqa: E402
+from app.schemas.task import TaskResponse  # noqa: E402
+
+SIZES = (1_000, 10_000)
+ROUNDS = 5
+
+
+def _rows(n: int) -> list[tuple]:
+    project_id, user_id = uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    return [
+        (
+            uuid4(), project_id, f"Task {i}", "Carried over from the last sprint",
+            statuses[i % len(statuses)], priorities[i % len(priorities)], user_id, user_id,
+            now, now, now, None,
+        )
+        for i in range(n)
+    ]
+
+
+def _best(fn) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    formats = [("json", JSON_MEDIA_TYPE), ("columnar", COLUMNAR_MEDIA_TYPE), ("msgpack", MSGPACK_MEDIA_TYPE)]
+
+    for size in SIZES:
+        rows = _rows(size)
+        baseline = None
+        for name, media_type in formats:
+            body = page_response(TaskResponse, rows, None, media_type=media_type).body
+            elapsed = _best(lambda rows=rows, media_type=media_type: page_response(TaskResponse, rows, None, media_type=media_type))
+            baseline = baseline or len(body)
+            print(
+                f"{size:>6} rows  {name:<9} {len(body) / 1024:9.1f} KiB ({len(body) / baseline:5.0%})"
+                f"  gzip {len(gzip.compress(body)) / 1024:8.1f} KiB  encode {elapsed * 1e3:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
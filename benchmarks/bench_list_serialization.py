@@ -0,0 +1,79 @@
+"""Task list serialization: FastAPI's response_model path vs. rows rendered by orjson.
+
+Run with: python -m benchmarks.bench_list_serialization
+"""
+import json
+import time
+
+from benchmarks._env import use_placeholder_settings
+
+use_placeholder_settings()
+
+from datetime import datetime, timezone  # noqa: E402
+from uuid import uuid4  # noqa: E402
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.api.responses import page_response  # noqa: E402
+from app.enums import TaskPriority, TaskStatus  # noqa: E402
+from app.models.task import Task  # noqa: E402
+from app.schemas.pagination import Page  # noqa: E402
+from app.schemas.task import TaskResponse  # noqa: E402
+
+SIZES = (1_000, 10_000)
+ROUNDS = 5
+
+
+def _rows(n: int) -> list[tuple]:
+    project_id, user_id = uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+    return [
+        (
+            uuid4(), project_id, f"Task {i}", "Carried over from the last sprint",
+            TaskStatus.IN_PROGRESS, TaskPriority.MEDIUM, user_id, user_id,
+            now, now, now, None,
+        )
+        for i in range(n)
+    ]
+
+
+def _best(fn, *args) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+_ADAPTER = TypeAdapter(Page[TaskResponse])
+
+
+def _validated(tasks: list[Task]) -> bytes:
+    # What a response_model route does with ORM objects: validate from
+    # attributes, dump, jsonable_encoder, then json.dumps
+    page = _ADAPTER.validate_python({"items": tasks, "next_cursor": None}, from_attributes=True)
+    content = jsonable_encoder(_ADAPTER.dump_python(page, mode="json"))
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _from_rows(rows: list[tuple]) -> bytes:
+    return page_response(TaskResponse, rows, None).body
+
+
+def main() -> None:
+    keys = tuple(TaskResponse.model_fields)
+
+    for size in SIZES:
+        rows = _rows(size)
+        tasks = [Task(**dict(zip(keys, row, strict=True))) for row in rows]
+
+        old, new = _best(_validated, tasks), _best(_from_rows, rows)
+        print(f"{size:>6} rows  response_model: {old * 1e3:8.2f} ms  {size / old:>10,.0f} rows/s")
+        print(f"{size:>6} rows  rows + orjson:  {new * 1e3:8.2f} ms  {size / new:>10,.0f} rows/s")
+        print(f"{size:>6} rows  speedup:        {old / new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
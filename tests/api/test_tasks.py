@@ -1,6 +1,6 @@
 """API tests for task endpoints (mocked auth and services)."""
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
@@ -11,9 +11,9 @@ from app.enums import ProjectRole, TaskPriority, TaskStatus
 
 @pytest.fixture
 def app_with_overrides(app, fake_user):
-    """Override get_db and get_current_user so endpoints run without real DB."""
-    from app.api.dependencies.auth import get_current_user
-    from app.core.database import get_db
+    """Override get_db and the auth dependencies so endpoints run without real DB."""
+    from app.api.dependencies.auth import get_current_user, get_current_user_id
+    from app.core.database import get_db, get_read_db
 
     async def override_get_db():
         yield None
@@ -21,9 +21,19 @@ def app_with_overrides(app, fake_user):
     async def override_current_user():
         return fake_user
 
+    async def override_current_user_id():
+        return fake_user.id
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = override_current_user
-    yield app
+    app.dependency_overrides[get_current_user_id] = override_current_user_id
+    with patch(
+        "app.api.v1.tasks.task_service.get_project_tasks_state",
+        new_callable=AsyncMock,
+        return_value=(0, None, None, None),
+    ):
+        yield app
     app.dependency_overrides.clear()
 
 
@@ -45,8 +55,7 @@ def test_create_task_201(client_override, fake_user):
     })()
 
     with (
-        patch("app.api.v1.tasks.project_service.get_membership", new_callable=AsyncMock, return_value=MagicMock(role=ProjectRole.MEMBER)),
-        patch("app.api.v1.tasks.project_service.get_project", new_callable=AsyncMock, return_value=object()),
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
         patch("app.api.v1.tasks.task_service.create_task", new_callable=AsyncMock, return_value=fake_task),
     ):
         resp = client_override.post(
@@ -62,8 +71,7 @@ def test_create_task_201(client_override, fake_user):
 def test_create_task_404_project_not_found(client_override, fake_user):
     project_id = uuid4()
     with (
-        patch("app.api.v1.tasks.project_service.get_membership", new_callable=AsyncMock, return_value=MagicMock(role=ProjectRole.MEMBER)),
-        patch("app.api.v1.tasks.project_service.get_project", new_callable=AsyncMock, return_value=None),
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, None)),
     ):
         resp = client_override.post(
             f"/api/v1/projects/{project_id}/tasks",
@@ -74,15 +82,633 @@ def test_create_task_404_project_not_found(client_override, fake_user):
     assert "not found" in resp.json()["detail"].lower()
 
 
+def test_create_task_403_not_member(client_override, fake_user):
+    project_id = uuid4()
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, None, object())),
+    ):
+        resp = client_override.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": "New"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
 def test_get_task_404(client_override, fake_user):
     project_id = uuid4()
     task_id = uuid4()
     with (
-        patch("app.api.v1.tasks.project_service.get_membership", new_callable=AsyncMock, return_value=MagicMock(role=ProjectRole.MEMBER)),
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
         patch("app.api.v1.tasks.task_service.get_task", new_callable=AsyncMock, return_value=None),
     ):
         resp = client_override.get(
             f"/api/v1/projects/{project_id}/tasks/{task_id}",
             headers={"Authorization": "Bearer any"},
         )
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+def test_list_tasks_returns_page(client_override, fake_user):
+    project_id = uuid4()
+    now = datetime.now()
+    fake_task = (
+        uuid4(), project_id, "Listed", None, TaskStatus.TODO, TaskPriority.LOW,
+        None, fake_user.id, None, now, now, None,
+    )
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_project_tasks", new_callable=AsyncMock, return_value=([fake_task], "next")) as get_tasks,
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks?limit=1",
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["next_cursor"] == "next"
+    assert [t["title"] for t in resp.json()["items"]] == ["Listed"]
+    assert get_tasks.await_args.kwargs["limit"] == 1
+    assert get_tasks.await_args.kwargs["cursor"] is None
+
+
+def test_list_tasks_negotiates_columnar_format(client_override, fake_user):
+    project_id = uuid4()
+    task_id = uuid4()
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_project_tasks", new_callable=AsyncMock, return_value=([(task_id, TaskStatus.DONE)], None)),
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            params={"fields": "status"},
+            headers={"Authorization": "Bearer any", "Accept": "application/vnd.taskforge.columnar+json"},
+        )
+        json_resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            params={"fields": "status"},
+            headers={"Authorization": "Bearer any"},
+        )
+        unsupported = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            headers={"Authorization": "Bearer any", "Accept": "text/csv"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"] == "application/vnd.taskforge.columnar+json"
+    assert "Accept" in resp.headers["vary"]
+    assert resp.json() == {
+        "columns": ["id", "status"],
+        "dictionaries": {"status": ["todo", "in_progress", "done"]},
+        "rows": [[str(task_id), 2]],
+        "next_cursor": None,
+    }
+    assert resp.headers["etag"] != json_resp.headers["etag"]
+    assert unsupported.status_code == status.HTTP_406_NOT_ACCEPTABLE
+
+
+def test_list_tasks_passes_filters_and_sort(client_override, fake_user):
+    project_id = uuid4()
+    assignee = uuid4()
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_project_tasks", new_callable=AsyncMock, return_value=([], None)) as get_tasks,
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            params={"status": ["todo", "in_progress"], "priority": "high", "assigned_to": str(assignee), "sort": "-due_date"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    filters = get_tasks.await_args.kwargs["filters"]
+    assert filters.status == [TaskStatus.TODO, TaskStatus.IN_PROGRESS]
+    assert filters.priority == [TaskPriority.HIGH]
+    assert filters.assigned_to == assignee
+    assert get_tasks.await_args.kwargs["sort"] == "-due_date"
+
+
+def test_list_tasks_rejects_conflicting_assignee_filters(client_override, fake_user):
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())):
+        resp = client_override.get(
+            f"/api/v1/projects/{uuid4()}/tasks",
+            params={"assigned_to": str(uuid4()), "unassigned": "true"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_permission_check_uses_read_session_for_safe_methods(app_with_overrides, client_override, fake_user):
+    from app.core.database import get_read_db
+
+    read_session = object()
+
+    async def override_get_read_db():
+        yield read_session
+
+    app_with_overrides.dependency_overrides[get_read_db] = override_get_read_db
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, None)) as get_context:
+        client_override.get(f"/api/v1/projects/{uuid4()}/tasks", headers={"Authorization": "Bearer any"})
+        assert get_context.await_args.args[0] is read_session
+
+        client_override.post(
+            f"/api/v1/projects/{uuid4()}/tasks",
+            json={"title": "New"},
+            headers={"Authorization": "Bearer any"},
+        )
+        assert get_context.await_args.args[0] is None
+
+
+def test_list_tasks_limit_is_capped(client_override, fake_user):
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())):
+        resp = client_override.get(
+            f"/api/v1/projects/{uuid4()}/tasks?limit=100000",
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_search_project_tasks(client_override, fake_user):
+    project_id = uuid4()
+    now = datetime.now()
+    fake_task = type("Task", (), {
+        "id": uuid4(), "project_id": project_id, "title": "Fix login",
+        "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.LOW,
+        "assigned_to": None, "created_by": fake_user.id, "due_date": None,
+        "created_at": now, "updated_at": now, "deleted_at": None,
+    })()
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.search_tasks", new_callable=AsyncMock, return_value=([(fake_task, 0.5)], None)) as search,
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks/search",
+            params={"q": "login"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["items"][0]["task"]["title"] == "Fix login"
+    assert resp.json()["items"][0]["rank"] == 0.5
+    assert search.await_args.kwargs["project_id"] == project_id
+
+
+def test_search_all_tasks_scopes_to_caller(client_override, fake_user):
+    with patch("app.api.v1.search.task_service.search_tasks", new_callable=AsyncMock, return_value=([], None)) as search:
+        resp = client_override.get(
+            "/api/v1/search/tasks",
+            params={"q": "login"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json() == {"items": [], "next_cursor": None}
+    assert search.await_args.kwargs["member_id"] == fake_user.id
+
+
+def test_search_requires_query(client_override, fake_user):
+    resp = client_override.get("/api/v1/search/tasks", headers={"Authorization": "Bearer any"})
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_list_my_tasks(client_override, fake_user):
+    with patch("app.api.v1.users.task_service.get_assigned_tasks", new_callable=AsyncMock, return_value=([], None)) as get_tasks:
+        resp = client_override.get(
+            "/api/v1/users/me/tasks",
+            params={"status": "todo", "sort": "due_date", "limit": 10},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json() == {"items": [], "next_cursor": None}
+    assert get_tasks.await_args.args[1] == fake_user.id
+    assert get_tasks.await_args.kwargs["filters"].status == [TaskStatus.TODO]
+    assert get_tasks.await_args.kwargs["sort"] == "due_date"
+
+
+def test_task_lists_share_filter_parameters(client_override):
+    paths = client_override.get("/openapi.json").json()["paths"]
+
+    def params(path):
+        return {param["name"] for param in paths[path]["get"]["parameters"] if param["in"] == "query"}
+
+    project_params = params("/api/v1/projects/{project_id}/tasks")
+    my_params = params("/api/v1/users/me/tasks")
+    assert project_params - my_params == {"assigned_to", "unassigned"}
+    assert {"status", "priority", "due_after", "due_before", "created_since", "updated_since"} <= my_params
+
+
+def test_create_tasks_bulk_reports_per_item(client_override, fake_user):
+    project_id = uuid4()
+    member, outsider = uuid4(), uuid4()
+    now = datetime.now()
+
+    def fake_task(title):
+        return type("Task", (), {
+            "id": uuid4(), "project_id": project_id, "title": title,
+            "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.MEDIUM,
+            "assigned_to": None, "created_by": fake_user.id, "due_date": None,
+            "created_at": now, "updated_at": now, "deleted_at": None,
+        })()
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.project_service.get_member_ids", new_callable=AsyncMock, return_value={member}) as get_members,
+        patch("app.api.v1.tasks.task_service.create_tasks", new_callable=AsyncMock, return_value=[fake_task("A"), fake_task("C")]) as create,
+    ):
+        resp = client_override.post(
+            f"/api/v1/projects/{project_id}/tasks/bulk",
+            json={"items": [
+                {"title": "A", "assigned_to": str(member)},
+                {"title": "B", "assigned_to": str(outsider)},
+                {"title": "C"},
+            ]},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    body = resp.json()
+    assert (body["succeeded"], body["failed"]) == (2, 1)
+    assert [r["task"]["title"] if r["task"] else None for r in body["results"]] == ["A", None, "C"]
+    assert "not a project member" in body["results"][1]["error"]
+    get_members.assert_awaited_once()
+    assert get_members.await_args.args[2] == {member, outsider}
+    assert [item.title for item in create.await_args.args[2]] == ["A", "C"]
+
+
+def test_create_tasks_bulk_rejects_oversized_batch(client_override, fake_user):
+    from app.core.config import settings
+
+    items = [{"title": "t"}] * (settings.TASK_BULK_MAX_ITEMS + 1)
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())):
+        resp = client_override.post(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk",
+            json={"items": items},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_update_tasks_bulk_groups_identical_patches(client_override, fake_user):
+    project_id = uuid4()
+    ids = [uuid4(), uuid4(), uuid4(), uuid4()]
+    now = datetime.now()
+    updated = {
+        task_id: type("Task", (), {
+            "id": task_id, "project_id": project_id, "title": "T",
+            "description": None, "status": TaskStatus.DONE, "priority": TaskPriority.MEDIUM,
+            "assigned_to": None, "created_by": fake_user.id, "due_date": None,
+            "created_at": now, "updated_at": now, "deleted_at": None,
+        })()
+        for task_id in ids[:3]
+    }
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.update_tasks", new_callable=AsyncMock, return_value=updated) as update_tasks,
+    ):
+        resp = client_override.patch(
+            f"/api/v1/projects/{project_id}/tasks/bulk",
+            json={"items": [
+                {"id": str(ids[0]), "patch": {"status": "done"}},
+                {"id": str(ids[1]), "patch": {"status": "done"}},
+                {"id": str(ids[2]), "patch": {"priority": "low"}},
+                {"id": str(ids[3]), "patch": {"status": "done"}},
+                {"id": str(ids[0]), "patch": {}},
+                {"id": str(ids[1]), "patch": {"title": None, "status": None, "description": None}},
+            ]},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    body = resp.json()
+    assert (body["succeeded"], body["failed"]) == (3, 3)
+    assert body["results"][3]["error"] == "Task not found"
+    assert body["results"][4]["error"] == "No fields to update"
+    assert body["results"][5]["error"] == "title, status cannot be null"
+    groups = update_tasks.await_args.args[2]
+    assert [task_ids for task_ids, _ in groups] == [[ids[0], ids[1], ids[3]], [ids[2]]]
+
+
+def test_update_tasks_bulk_by_filter(client_override, fake_user):
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.update_matching_tasks", new_callable=AsyncMock, return_value=[]) as update_matching,
+    ):
+        resp = client_override.patch(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk",
+            json={"filter": {"status": ["in_progress"]}, "patch": {"status": "done"}},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    filters, values = update_matching.await_args.args[2:4]
+    assert filters.status == [TaskStatus.IN_PROGRESS]
+    assert values == {"status": TaskStatus.DONE}
+
+
+def test_update_tasks_bulk_requires_one_target(client_override, fake_user):
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())):
+        resp = client_override.patch(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk",
+            json={"ids": [str(uuid4())], "filter": {}, "patch": {"status": "done"}},
+            headers={"Authorization": "Bearer any"},
+        )
+        empty_filter = client_override.patch(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk",
+            json={"filter": {"priority": []}, "patch": {"status": "done"}},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert empty_filter.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_bulk_delete_and_restore_return_counts(client_override, fake_user):
+    project_id = uuid4()
+    task_ids = [str(uuid4()), str(uuid4())]
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.soft_delete_tasks", new_callable=AsyncMock, return_value=12) as soft_delete,
+        patch("app.api.v1.tasks.task_service.restore_tasks", new_callable=AsyncMock, return_value=2) as restore,
+    ):
+        deleted = client_override.post(
+            f"/api/v1/projects/{project_id}/tasks/bulk/delete",
+            json={"filter": {"status": ["done"]}},
+            headers={"Authorization": "Bearer any"},
+        )
+        restored = client_override.post(
+            f"/api/v1/projects/{project_id}/tasks/bulk/restore",
+            json={"ids": task_ids},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert deleted.json() == {"affected": 12}
+    assert restored.json() == {"affected": 2}
+    assert soft_delete.await_args.kwargs["filters"].status == [TaskStatus.DONE]
+    assert [str(task_id) for task_id in restore.await_args.kwargs["ids"]] == task_ids
+
+
+def test_bulk_delete_requires_selection(client_override, fake_user):
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())):
+        resp = client_override.post(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk/delete",
+            json={},
+            headers={"Authorization": "Bearer any"},
+        )
+        empty_filter = client_override.post(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk/delete",
+            json={"filter": {"status": None}},
+            headers={"Authorization": "Bearer any"},
+        )
+        empty_lists = client_override.post(
+            f"/api/v1/projects/{uuid4()}/tasks/bulk/restore",
+            json={"filter": {"status": [], "priority": []}},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert empty_filter.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert empty_lists.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_list_tasks_with_fields_returns_only_those_fields(client_override, fake_user):
+    project_id = uuid4()
+    task_id = uuid4()
+    fake_task = (task_id, "Board card", TaskStatus.TODO)
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_project_tasks", new_callable=AsyncMock, return_value=([fake_task], None)) as get_tasks,
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            params={"fields": "title,status"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["items"] == [{"id": str(task_id), "title": "Board card", "status": "todo"}]
+    assert get_tasks.await_args.kwargs["fields"] == ("id", "title", "status")
+
+
+def test_get_task_rejects_unknown_fields(client_override, fake_user):
+    with patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())):
+        resp = client_override.get(
+            f"/api/v1/projects/{uuid4()}/tasks/{uuid4()}",
+            params={"fields": "title,hashed_password"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert "hashed_password" in resp.json()["detail"]
+
+
+def _stream_rows(*batches):
+    async def stream(*_args, **_kwargs):
+        for batch in batches:
+            yield batch
+    return stream
+
+
+def test_export_tasks_streams_ndjson(client_override, fake_user):
+    now = datetime.now()
+    row = type("Row", (), {
+        "id": uuid4(), "project_id": uuid4(), "title": "Exported",
+        "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.LOW,
+        "assigned_to": None, "created_by": fake_user.id, "due_date": None,
+        "created_at": now, "updated_at": now, "deleted_at": None,
+    })()
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.stream_project_tasks", new=_stream_rows([row], [row])),
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{uuid4()}/tasks/export",
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert resp.text.count("Exported") == 2
+
+
+def test_export_tasks_csv_gzip(client_override, fake_user):
+    import gzip
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.stream_project_tasks", new=_stream_rows()),
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{uuid4()}/tasks/export",
+            params={"format": "csv", "gzip": "true"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"] == "application/gzip"
+    assert ".csv.gz" in resp.headers["content-disposition"]
+    assert gzip.decompress(resp.content).decode().startswith("id,project_id,title")
+
+
+def test_import_tasks_streams_body_to_service(client_override, fake_user):
+    project_id = uuid4()
+
+    async def fake_import(_db, report, records, creator_id, *, batch_size):
+        report.rows_read = len([record async for record in records])
+        report.status = "completed"
+        assert creator_id == fake_user.id
+        return report
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_import_service.import_tasks", new=fake_import),
+    ):
+        resp = client_override.post(
+            f"/api/v1/projects/{project_id}/tasks/import",
+            params={"format": "csv"},
+            content=b"title,priority\nA,high\nB,low\n",
+            headers={"Authorization": "Bearer any"},
+        )
+        import_id = resp.json()["id"]
+        listed = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks/imports",
+            headers={"Authorization": "Bearer any"},
+        )
+        missing = client_override.get(
+            f"/api/v1/projects/{uuid4()}/tasks/imports/{import_id}",
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["rows_read"] == 2
+    assert [report["id"] for report in listed.json()] == [import_id]
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_list_tasks_returns_304_for_matching_etag(client_override, fake_user):
+    project_id = uuid4()
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_project_tasks", new_callable=AsyncMock, return_value=([], None)) as get_tasks,
+    ):
+        first = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks?limit=5",
+            headers={"Authorization": "Bearer any"},
+        )
+        etag = first.headers["etag"]
+        second = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks?limit=5",
+            headers={"Authorization": "Bearer any", "If-None-Match": etag},
+        )
+        other_query = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks?limit=6",
+            headers={"Authorization": "Bearer any", "If-None-Match": etag},
+        )
+    assert second.status_code == status.HTTP_304_NOT_MODIFIED
+    assert second.headers["etag"] == etag
+    assert "Accept" in second.headers["vary"]
+    assert other_query.status_code == status.HTTP_200_OK
+    assert get_tasks.await_count == 2
+
+
+def test_get_task_304_skips_loading_the_row(client_override, fake_user):
+    project_id = uuid4()
+    task_id = uuid4()
+    now = datetime.now()
+    fake_task = type("Task", (), {
+        "id": task_id, "project_id": project_id, "title": "Cached",
+        "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.LOW,
+        "assigned_to": None, "created_by": fake_user.id, "due_date": None,
+        "created_at": now, "updated_at": now, "deleted_at": None, "version": 3,
+    })()
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_task", new_callable=AsyncMock, return_value=fake_task) as get_task,
+        patch("app.api.v1.tasks.task_service.get_task_version", new_callable=AsyncMock, return_value=3),
+    ):
+        first = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks/{task_id}",
+            headers={"Authorization": "Bearer any"},
+        )
+        second = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks/{task_id}",
+            headers={"Authorization": "Bearer any", "If-None-Match": first.headers["etag"]},
+        )
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_304_NOT_MODIFIED
+    get_task.assert_awaited_once()
+
+
+def test_task_changes_split_tombstones(client_override, fake_user):
+    project_id = uuid4()
+    now = datetime.now()
+
+    def fake_task(deleted_at):
+        return type("Task", (), {
+            "id": uuid4(), "project_id": project_id, "title": "T",
+            "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.LOW,
+            "assigned_to": None, "created_by": fake_user.id, "due_date": None,
+            "created_at": now, "updated_at": now, "deleted_at": deleted_at,
+        })()
+
+    live, gone = fake_task(None), fake_task(now)
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_task_changes", new_callable=AsyncMock, return_value=([live, gone], "wm", False)) as get_changes,
+    ):
+        resp = client_override.get(
+            f"/api/v1/projects/{project_id}/tasks/changes",
+            params={"since": "old"},
+            headers={"Authorization": "Bearer any"},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    body = resp.json()
+    assert [t["id"] for t in body["updated"]] == [str(live.id)]
+    assert body["deleted"] == [{"id": str(gone.id), "deleted_at": now.isoformat()}]
+    assert (body["watermark"], body["has_more"]) == ("wm", False)
+    assert get_changes.await_args.kwargs["since"] == "old"
+
+
+def _versioned_task(project_id, creator_id, version):
+    now = datetime.now()
+    return type("Task", (), {
+        "id": uuid4(), "project_id": project_id, "title": "Versioned",
+        "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.LOW,
+        "assigned_to": None, "created_by": creator_id, "due_date": None,
+        "created_at": now, "updated_at": now, "deleted_at": None, "version": version,
+    })()
+
+
+def test_update_task_with_if_match_returns_new_etag(client_override, fake_user):
+    project_id = uuid4()
+    task = _versioned_task(project_id, fake_user.id, 3)
+    updated = _versioned_task(project_id, fake_user.id, 4)
+    updated.id = task.id
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_task", new_callable=AsyncMock, return_value=task),
+        patch("app.api.v1.tasks.task_service.update_task", new_callable=AsyncMock, return_value=updated) as update_task,
+    ):
+        resp = client_override.patch(
+            f"/api/v1/projects/{project_id}/tasks/{task.id}",
+            json={"status": "done"},
+            headers={"Authorization": "Bearer any", "If-Match": f'"{task.id}.3.abc123"'},
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["etag"] == f'"{task.id}.4"'
+    assert update_task.await_args.args[3] == 3
+
+
+def test_update_task_with_stale_if_match_is_412(client_override, fake_user):
+    from app.utils.etag import VersionConflictError
+
+    project_id = uuid4()
+    task = _versioned_task(project_id, fake_user.id, 3)
+
+    with (
+        patch("app.api.v1.tasks.project_service.get_project_context", new_callable=AsyncMock, return_value=(fake_user, ProjectRole.MEMBER, object())),
+        patch("app.api.v1.tasks.task_service.get_task", new_callable=AsyncMock, return_value=task),
+        patch("app.api.v1.tasks.task_service.update_task", new_callable=AsyncMock, side_effect=VersionConflictError()) as update_task,
+    ):
+        stale = client_override.patch(
+            f"/api/v1/projects/{project_id}/tasks/{task.id}",
+            json={"status": "done"},
+            headers={"Authorization": "Bearer any", "If-Match": f'"{task.id}.2"'},
+        )
+        raced = client_override.patch(
+            f"/api/v1/projects/{project_id}/tasks/{task.id}",
+            json={"status": "done"},
+            headers={"Authorization": "Bearer any", "If-Match": f'"{task.id}.3"'},
+        )
+    assert stale.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert raced.status_code == status.HTTP_412_PRECONDITION_FAILED
+    update_task.assert_awaited_once()
@@ -31,4 +31,5 @@ def fake_user():
     u = type("User", (), {})()
     u.id = uuid4()
     u.system_role = SystemRole.USER
+    u.is_active = True
     return u
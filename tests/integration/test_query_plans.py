@@ -0,0 +1,87 @@
+"""EXPLAIN the service queries against a migrated database.
+
+Set TEST_DATABASE_URL (postgresql+asyncpg://...) to a database upgraded to
+alembic head to run these.
+"""
+import os
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services import project as project_service
+from app.services import task as task_service
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+
+async def _captured_statement(service_call, *args, **kwargs):
+    db = AsyncMock(spec=AsyncSession)
+    db.execute.return_value = MagicMock()
+    db.scalar.return_value = None
+    await service_call(db, *args, **kwargs)
+    call = (db.execute.await_args or db.scalar.await_args)
+    return call.args[0]
+
+
+async def _plan(stmt) -> str:
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.connect() as conn:
+            # Tiny test tables would otherwise always be sequentially scanned
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+            result = await conn.exec_driver_sql(f"EXPLAIN {sql}")
+            return "\n".join(result.scalars().all())
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_project_tasks_use_live_partial_index():
+    await project_service.membership_cache.clear()
+    stmt = await _captured_statement(task_service.get_project_tasks, uuid4(), limit=50)
+
+    assert "ix_tasks_project_id_live" in await _plan(stmt)
+
+
+@pytest.mark.asyncio
+async def test_member_role_is_index_only_scan():
+    await project_service.membership_cache.clear()
+    stmt = await _captured_statement(project_service.get_member_role, uuid4(), uuid4())
+
+    assert "Index Only Scan using ix_project_members_user_id_project_id" in await _plan(stmt)
+
+
+@pytest.mark.asyncio
+async def test_user_projects_use_covering_membership_index():
+    stmt = await _captured_statement(project_service.get_user_projects, uuid4())
+
+    assert "ix_project_members_user_id_project_id" in await _plan(stmt)
+
+
+@pytest.mark.asyncio
+async def test_search_uses_gin_index():
+    stmt = await _captured_statement(task_service.search_tasks, "login", limit=50, member_id=uuid4())
+
+    assert "ix_tasks_search_vector" in await _plan(stmt)
+
+
+@pytest.mark.asyncio
+async def test_assigned_tasks_use_assignee_index():
+    stmt = await _captured_statement(task_service.get_assigned_tasks, uuid4(), limit=50)
+
+    assert "ix_tasks_assigned_to_status_due_date_live" in await _plan(stmt)
+
+
+@pytest.mark.asyncio
+async def test_task_changes_use_updated_at_index():
+    stmt = await _captured_statement(task_service.get_task_changes, uuid4(), since=None, limit=50, settle_seconds=5)
+
+    assert "ix_tasks_project_id_updated_at" in await _plan(stmt)
@@ -0,0 +1,110 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.core import database
+from app.core.config import settings
+
+
+def test_engine_uses_configured_pool():
+    status = database.pool_status(database.engine)
+
+    assert isinstance(database.engine.pool, database.InstrumentedPool)
+    assert status["size"] == settings.DB_POOL_SIZE
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 0
+
+
+def test_pgbouncer_profile_disables_prepared_statement_caches(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_TRANSACTION_MODE", True)
+
+    connect_args = database.engine_options()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+
+
+def test_replica_router_round_robins_and_skips_down_replicas():
+    first, second = object(), object()
+    router = database.ReplicaRouter([first, second], retry_seconds=60)
+
+    assert router.candidates() == [first, second]
+    assert router.candidates() == [second, first]
+
+    router.mark_down(first)
+    assert router.candidates() == [second]
+    assert router.candidates() == [second]
+
+
+def _request():
+    request = type("Request", (), {})()
+    request.headers = {}
+    request.state = type("State", (), {})()
+    return request
+
+
+async def test_get_read_db_fails_over_to_primary(monkeypatch):
+    replica = database.create_async_engine(
+        "postgresql+asyncpg://u:p@127.0.0.1:1/db", connect_args={"timeout": 1}
+    )
+    router = database.ReplicaRouter([replica], retry_seconds=60)
+    monkeypatch.setattr(database, "replica_router", router)
+
+    sessions = database.get_read_db(_request())
+    session = await anext(sessions)
+    opened = await session._open()
+
+    assert opened.bind is database.engine
+    assert router.candidates() == []
+    await sessions.aclose()
+    await replica.dispose()
+
+
+async def test_get_db_is_lazy_and_counts_untouched_requests(monkeypatch):
+    monkeypatch.setattr(database, "session_stats", {"requests": 0, "requests_without_db": 0})
+    request = _request()
+
+    primary = database.get_db(request)
+    read = database.get_read_db(request)
+    session = await anext(primary)
+    await anext(read)
+
+    assert session._session is None
+    await primary.aclose()
+    assert database.session_stats["requests"] == 0
+    await read.aclose()
+    assert database.session_stats == {"requests": 1, "requests_without_db": 1}
+
+
+async def test_pool_counts_only_checkout_timeouts_and_excludes_connect_time():
+    def slow_connect():
+        time.sleep(0.05)
+        return MagicMock()
+
+    def failing_connect():
+        raise OSError("connection refused")
+
+    pool = database.InstrumentedPool(slow_connect, pool_size=1, max_overflow=0, timeout=0.01)
+
+    def checkouts():
+        held = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        held.close()
+
+    await greenlet_spawn(checkouts)
+
+    assert pool.connects == 1
+    assert pool.connect_seconds_total >= 0.05
+    assert pool.timeouts == 1
+    assert pool.checkouts == 2
+    assert pool.wait_seconds_max < 0.05
+
+    broken = database.InstrumentedPool(failing_connect, pool_size=1, max_overflow=0)
+    with pytest.raises(OSError):
+        await greenlet_spawn(broken.connect)
+    assert broken.timeouts == 0
@@ -0,0 +1,30 @@
+from uuid import uuid4
+
+from app.utils.etag import etag_matches, if_match_version, make_etag, resource_etag
+
+
+def test_make_etag_is_stable_and_quoted():
+    etag = make_etag("a", 1, None)
+
+    assert etag == make_etag("a", 1, None)
+    assert etag != make_etag("a", 2, None)
+    assert etag.startswith('"') and etag.endswith('"')
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard():
+    etag = make_etag("a")
+
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_if_match_version_reads_full_and_sparse_tags():
+    resource_id = uuid4()
+
+    assert if_match_version(resource_etag(resource_id, 7), resource_id) == 7
+    assert if_match_version(resource_etag(resource_id, 7, ("id", "title")), resource_id) == 7
+    assert if_match_version(resource_etag(uuid4(), 7), resource_id) is None
+    assert if_match_version(f"W/{resource_etag(resource_id, 7)}", resource_id) is None
+    assert resource_etag(resource_id, 7, ("id",)) != resource_etag(resource_id, 7, ("id", "title"))
@@ -0,0 +1,52 @@
+import gzip
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.enums import TaskPriority, TaskStatus
+from app.schemas.task import TaskResponse
+from app.utils.export import CsvEncoder, NdjsonEncoder, gzip_chunks
+
+
+def _row(title):
+    now = datetime(2026, 1, 1, 12, 0)
+    return type("Row", (), {
+        "id": uuid4(), "project_id": uuid4(), "title": title,
+        "description": None, "status": TaskStatus.TODO, "priority": TaskPriority.HIGH,
+        "assigned_to": None, "created_by": uuid4(), "due_date": None,
+        "created_at": now, "updated_at": now, "deleted_at": None,
+    })()
+
+
+def test_ndjson_encoder_writes_one_object_per_line():
+    rows = [_row("a"), _row("b")]
+    encoder = NdjsonEncoder(TaskResponse)
+
+    lines = (encoder.header() + encoder.encode(rows)).splitlines()
+
+    assert [json.loads(line)["title"] for line in lines] == ["a", "b"]
+    assert json.loads(lines[0])["status"] == "todo"
+
+
+def test_csv_encoder_writes_header_once():
+    encoder = CsvEncoder(TaskResponse)
+
+    data = encoder.header() + encoder.encode([_row("a, quoted")]) + encoder.encode([_row("b")])
+
+    lines = data.decode().splitlines()
+    assert lines[0].split(",") == list(TaskResponse.model_fields)
+    assert '"a, quoted"' in lines[1]
+    assert len(lines) == 3
+
+
+@pytest.mark.asyncio
+async def test_gzip_chunks_produce_one_valid_member():
+    async def chunks():
+        yield b"first\n"
+        yield b"second\n"
+
+    compressed = b"".join([chunk async for chunk in gzip_chunks(chunks())])
+
+    assert gzip.decompress(compressed) == b"first\nsecond\n"
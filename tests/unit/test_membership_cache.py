@@ -0,0 +1,143 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.authorization import ProjectPermission
+from app.enums import ProjectRole, SystemRole
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+from app.services import project as project_service
+from app.services import user as user_service
+
+
+@pytest.fixture(autouse=True)
+async def clear_membership_cache():
+    await project_service.membership_cache.clear()
+    user_service.principal_cache.clear()
+    yield
+    await project_service.membership_cache.clear()
+    user_service.principal_cache.clear()
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_get_member_role_caches_role(mock_db):
+    project_id, user_id = uuid4(), uuid4()
+    mock_db.scalar.return_value = ProjectRole.ADMIN
+
+    assert await project_service.get_member_role(mock_db, project_id, user_id) == ProjectRole.ADMIN
+    assert await project_service.get_member_role(mock_db, project_id, user_id) == ProjectRole.ADMIN
+
+    mock_db.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_member_role_selects_only_role(mock_db):
+    mock_db.scalar.return_value = None
+
+    await project_service.get_member_role(mock_db, uuid4(), uuid4())
+
+    stmt = mock_db.scalar.await_args.args[0]
+    assert [c.name for c in stmt.selected_columns] == ["role"]
+
+
+@pytest.mark.asyncio
+async def test_get_member_role_caches_non_members(mock_db):
+    project_id, user_id = uuid4(), uuid4()
+    mock_db.scalar.return_value = None
+
+    assert await project_service.get_member_role(mock_db, project_id, user_id) is None
+    assert await project_service.get_member_role(mock_db, project_id, user_id) is None
+
+    mock_db.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_membership_writes_invalidate_cache(mock_db):
+    project_id, user_id = uuid4(), uuid4()
+    mock_db.scalar.return_value = None
+    await project_service.get_member_role(mock_db, project_id, user_id)
+
+    await project_service.add_member(mock_db, project_id, user_id, ProjectRole.MEMBER)
+
+    mock_db.scalar.return_value = ProjectRole.MEMBER
+    assert await project_service.get_member_role(mock_db, project_id, user_id) == ProjectRole.MEMBER
+
+    await project_service.remove_member(mock_db, ProjectMember(project_id=project_id, user_id=user_id, role=ProjectRole.MEMBER))
+
+    mock_db.scalar.return_value = None
+    assert await project_service.get_member_role(mock_db, project_id, user_id) is None
+
+
+def _request(method="GET"):
+    return MagicMock(method=method)
+
+
+def _context_row(db, role, system_role=SystemRole.USER):
+    user = User(
+        id=uuid4(),
+        email="a@example.com",
+        username="alice",
+        hashed_password=None,
+        system_role=system_role,
+        is_active=True,
+        is_verified=True,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        deleted_at=None,
+    )
+    project = Project(id=uuid4(), name="p")
+    db.execute.return_value = MagicMock(one_or_none=MagicMock(return_value=(user, role, project)))
+    return user, project
+
+
+@pytest.mark.asyncio
+async def test_project_permission_served_from_caches(mock_db):
+    user, project = _context_row(mock_db, ProjectRole.MEMBER)
+    permission = ProjectPermission(ProjectRole.MEMBER)
+
+    first = await permission(_request(), project.id, user.id, mock_db, mock_db)
+    second = await permission(_request(), project.id, user.id, mock_db, mock_db)
+
+    mock_db.execute.assert_awaited_once()
+    assert first.project is project
+    assert second.role == ProjectRole.MEMBER
+    assert second.user.id == user.id
+
+    with pytest.raises(HTTPException) as exc:
+        await ProjectPermission(ProjectRole.ADMIN)(_request(), project.id, user.id, mock_db, mock_db)
+    assert exc.value.status_code == 403
+    mock_db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_project_permission_loads_project_when_asked(mock_db):
+    user, project = _context_row(mock_db, ProjectRole.MEMBER)
+    await ProjectPermission(ProjectRole.VIEWER)(_request(), project.id, user.id, mock_db, mock_db)
+
+    ctx = await ProjectPermission(ProjectRole.VIEWER, load_project=True)(_request(), project.id, user.id, mock_db, mock_db)
+
+    assert ctx.project is project
+    assert mock_db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_project_permission_admin_non_member_falls_back(mock_db):
+    user, project = _context_row(mock_db, None, SystemRole.SYSTEM_ADMIN)
+    permission = ProjectPermission(ProjectRole.OWNER)
+
+    await permission(_request(), project.id, user.id, mock_db, mock_db)
+    ctx = await permission(_request(), project.id, user.id, mock_db, mock_db)
+
+    assert ctx.role == ProjectRole.OWNER
+    assert mock_db.execute.await_count == 2
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from app.core.hashing import HashingOverloadedError, PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    h = PasswordHasher(executor="thread", max_workers=1, max_queue=1, retry_after=2)
+    yield h
+    h.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip(hasher):
+    hashed = await hasher.hash("Secret!Pass")
+
+    assert await hasher.verify("Secret!Pass", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.stats()["completed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full(hasher):
+    running = asyncio.gather(hasher.hash("a"), hasher.hash("b"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HashingOverloadedError) as exc_info:
+        await hasher.hash("c")
+
+    await running
+    assert exc_info.value.retry_after == 2
+    assert hasher.stats()["rejected"] == 1
@@ -0,0 +1,90 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MemoryCacheBackend, TTLCache
+from app.enums import SystemRole
+from app.models.user import User
+from app.services import user as user_service
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    user_service.principal_cache.clear()
+    yield
+    user_service.principal_cache.clear()
+
+
+def _user():
+    return User(
+        id=uuid4(),
+        email="a@example.com",
+        username="alice",
+        hashed_password=None,
+        system_role=SystemRole.USER,
+        is_active=True,
+        is_verified=True,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        deleted_at=None,
+    )
+
+
+def test_ttl_cache_expires_and_evicts():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b", None) is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.set("d", 4, ttl=-1)
+    assert cache.get("d", None) is None
+
+
+def test_ttl_cache_disabled_with_zero_ttl():
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a", None) is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_get_prefix():
+    backend = MemoryCacheBackend("test", maxsize=10, ttl=60)
+    await backend.set("p1:a", "1")
+    await backend.set("p1:b", "2")
+    await backend.set("p2:a", "3")
+    await backend.set("p1:c", "4", ttl=-1)
+
+    assert await backend.get_prefix("p1:") == {"p1:a": "1", "p1:b": "2"}
+
+
+@pytest.mark.asyncio
+async def test_get_principal_hits_db_once():
+    user = _user()
+    with patch.object(user_service, "get_user_by_id", new_callable=AsyncMock, return_value=user) as get_user:
+        first = await user_service.get_principal(AsyncSession(), user.id)
+        second = await user_service.get_principal(AsyncSession(), user.id)
+
+    get_user.assert_awaited_once()
+    assert first is user
+    assert second is not user
+    assert second.id == user.id
+    assert second.email == user.email
+
+
+@pytest.mark.asyncio
+async def test_invalidate_principal_forces_reload():
+    user = _user()
+    with patch.object(user_service, "get_user_by_id", new_callable=AsyncMock, return_value=user) as get_user:
+        await user_service.get_principal(AsyncSession(), user.id)
+        user_service.invalidate_principal(user.id)
+        await user_service.get_principal(AsyncSession(), user.id)
+
+    assert get_user.await_count == 2
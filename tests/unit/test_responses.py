@@ -0,0 +1,93 @@
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import msgpack
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies.negotiation import list_media_type
+from app.api.responses import (
+    COLUMNAR_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    ORJSONResponse,
+    columnar_content,
+    page_response,
+    row_items,
+)
+from app.enums import TaskPriority, TaskStatus
+from app.schemas.task import TaskResponse
+
+
+def _row():
+    now = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+    return (
+        uuid4(), uuid4(), "Title", None, TaskStatus.DONE, TaskPriority.HIGH,
+        None, uuid4(), None, now, now, None,
+    )
+
+
+def test_rows_render_like_the_validated_model():
+    row = _row()
+    expected = TaskResponse.model_validate(dict(zip(TaskResponse.model_fields, row, strict=True))).model_dump(mode="json")
+
+    [item] = json.loads(ORJSONResponse(row_items(TaskResponse, [row])).body)
+
+    assert item == expected
+    assert item["created_at"] == "2025-01-02T03:04:05.678000Z"
+
+
+def test_page_response_drops_trailing_keyset_columns():
+    task_id = uuid4()
+    response = page_response(TaskResponse, [(task_id, "Title", TaskPriority.LOW)], "next", ("id", "title"))
+
+    assert json.loads(response.body) == {"items": [{"id": str(task_id), "title": "Title"}], "next_cursor": "next"}
+    assert response.media_type == "application/json"
+
+
+def test_columnar_content_dictionary_encodes_enums():
+    first, second = _row(), _row()
+    second = second[:4] + (TaskStatus.TODO, TaskPriority.LOW) + second[6:]
+
+    content = columnar_content(TaskResponse, [first, second])
+
+    assert content["columns"] == list(TaskResponse.model_fields)
+    assert content["dictionaries"] == {"status": ["todo", "in_progress", "done"], "priority": ["low", "medium", "high", "urgent"]}
+    status_at, priority_at = content["columns"].index("status"), content["columns"].index("priority")
+    assert [row[status_at] for row in content["rows"]] == [2, 0]
+    assert [row[priority_at] for row in content["rows"]] == [2, 0]
+    assert content["rows"][0][0] == first[0]
+
+
+def test_msgpack_page_matches_json_page():
+    row = _row()
+
+    response = page_response(TaskResponse, [row], None, media_type=MSGPACK_MEDIA_TYPE)
+    [item] = msgpack.unpackb(response.body, timestamp=3)["items"]
+
+    assert response.media_type == MSGPACK_MEDIA_TYPE
+    assert item["id"] == str(row[0])
+    assert item["status"] == "done"
+    assert item["created_at"] == row[9]
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        (f"{COLUMNAR_MEDIA_TYPE}, application/json;q=0.5", COLUMNAR_MEDIA_TYPE),
+        (f"application/json;q=0.5, {COLUMNAR_MEDIA_TYPE}", COLUMNAR_MEDIA_TYPE),
+        (f"{COLUMNAR_MEDIA_TYPE};q=0, application/json", JSON_MEDIA_TYPE),
+    ],
+)
+def test_list_media_type_honours_quality(accept, expected):
+    assert list_media_type(accept) == expected
+
+
+def test_list_media_type_rejects_unsupported():
+    with pytest.raises(HTTPException) as exc_info:
+        list_media_type("text/csv")
+    assert exc_info.value.status_code == 406
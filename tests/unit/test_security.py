@@ -0,0 +1,47 @@
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from app.core import security
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security.token_cache.clear()
+    yield
+    security.token_cache.clear()
+
+
+def test_decode_token_caches_verified_claims(monkeypatch):
+    user_id = uuid4()
+    token = security.create_access_token(user_id)
+    assert security.decode_token(token)["sub"] == str(user_id)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token should be served from cache")
+
+    monkeypatch.setattr(security.jwt, "decode", fail)
+    payload = security.decode_token(token)
+    payload["sub"] = "tampered"
+
+    assert security.decode_token(token)["sub"] == str(user_id)
+
+
+def test_decode_token_rejects_expired_cached_entry(monkeypatch):
+    token = security.create_access_token(uuid4(), expires_delta=timedelta(seconds=30))
+    security.decode_token(token)
+
+    later = time.time() + 60
+    monkeypatch.setattr(security.time, "time", lambda: later)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        security.decode_token(token)
+
+
+def test_decode_token_does_not_cache_invalid_tokens():
+    token = security.create_access_token(uuid4()) + "x"
+    with pytest.raises(jwt.InvalidTokenError):
+        security.decode_token(token)
+    assert len(security.token_cache) == 0
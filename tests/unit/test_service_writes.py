@@ -0,0 +1,88 @@
+"""Write paths in the project and user services use a single RETURNING statement."""
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import ProjectRole
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.user import UserCreate, UserUpdate
+from app.services import project as project_service
+from app.services import user as user_service
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    return db
+
+
+def _statements(db):
+    return [call.args[0] for call in db.scalar.await_args_list + db.execute.await_args_list]
+
+
+def _assert_round_trips(db, expected):
+    statements = _statements(db)
+    assert len(statements) == expected
+    db.refresh.assert_not_awaited()
+    db.flush.assert_not_awaited()
+    db.commit.assert_awaited_once()
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_create_project_inserts_project_and_owner(mock_db):
+    mock_db.scalar.return_value = Project(id=uuid4(), name="P")
+
+    await project_service.create_project(mock_db, ProjectCreate(name="P"), uuid4())
+
+    project_stmt, member_stmt = _assert_round_trips(mock_db, 2)
+    assert project_stmt.is_insert and project_stmt._returning
+    assert member_stmt.compile().params["role"] == ProjectRole.OWNER
+
+
+@pytest.mark.asyncio
+async def test_update_project_uses_update_returning(mock_db):
+    project = Project(id=uuid4(), name="Old")
+    mock_db.scalar.return_value = project
+
+    await project_service.update_project(mock_db, project, ProjectUpdate(name="New"))
+
+    [stmt] = _assert_round_trips(mock_db, 1)
+    assert stmt.is_update and stmt._returning
+
+
+@pytest.mark.asyncio
+async def test_member_writes_use_returning(mock_db):
+    member = ProjectMember(id=uuid4(), project_id=uuid4(), user_id=uuid4(), role=ProjectRole.MEMBER)
+    mock_db.scalar.return_value = member
+
+    await project_service.add_member(mock_db, member.project_id, member.user_id, ProjectRole.MEMBER)
+    [stmt] = _assert_round_trips(mock_db, 1)
+    assert stmt.is_insert and stmt._returning
+
+    mock_db.reset_mock()
+    await project_service.update_member_role(mock_db, member, ProjectRole.ADMIN)
+    [stmt] = _assert_round_trips(mock_db, 1)
+    assert stmt.is_update and stmt._returning
+
+
+@pytest.mark.asyncio
+async def test_user_writes_use_returning(mock_db):
+    user = User(id=uuid4(), email="a@example.com")
+    mock_db.scalar.return_value = user
+
+    with patch.object(user_service.password_hasher, "hash", new_callable=AsyncMock, return_value="hashed"):
+        await user_service.create_user(mock_db, UserCreate(email="a@example.com", password="Secret!Pass"))
+    [stmt] = _assert_round_trips(mock_db, 1)
+    assert stmt.is_insert and stmt._returning
+    assert stmt.compile().params["hashed_password"] == "hashed"
+
+    mock_db.reset_mock()
+    await user_service.update_user(mock_db, user, UserUpdate(username="alice"))
+    [stmt] = _assert_round_trips(mock_db, 1)
+    assert stmt.is_update and stmt._returning
@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import task_import as task_import_service
+from app.utils.imports import RecordError, read_csv_records, read_ndjson_records
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.asyncio
+async def test_read_ndjson_records_across_chunk_boundaries():
+    records = await _collect(read_ndjson_records(_chunks(b'{"title": "a"}\n{"ti', b'tle": "b"}\n\nnot json\n[1]')))
+
+    assert records[0] == (1, {"title": "a"})
+    assert records[1] == (2, {"title": "b"})
+    assert records[2][0] == 4 and isinstance(records[2][1], RecordError)
+    assert records[3][0] == 5 and isinstance(records[3][1], RecordError)
+
+
+@pytest.mark.asyncio
+async def test_read_csv_records_handles_multiline_fields():
+    body = b'title,description,priority\r\nFirst,"line one\nline ""two""",high\r\nSecond,,\r\nbad\r\n'
+
+    records = await _collect(read_csv_records(_chunks(body[:20], body[20:])))
+
+    assert records[0] == (2, {"title": "First", "description": 'line one\nline "two"', "priority": "high"})
+    assert records[1] == (4, {"title": "Second"})
+    assert records[2][0] == 5 and isinstance(records[2][1], RecordError)
+
+
+@pytest.fixture
+def import_db():
+    raw = MagicMock()
+    raw.staged = []
+
+    async def copy_to_table(table, *, source, columns):
+        raw.staged = [line.split("\t") for line in source.read().decode().splitlines()]
+
+    raw.copy_to_table = AsyncMock(side_effect=copy_to_table)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=raw))
+
+    db = AsyncMock(spec=AsyncSession)
+    db.connection.return_value = connection
+    db.execute.side_effect = [
+        MagicMock(),
+        MagicMock(**{"one.return_value": (1, [3])}),
+        MagicMock(rowcount=2),
+    ]
+    return db, raw
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_copies_in_batches_and_reports(import_db):
+    db, raw = import_db
+    report = await task_import_service.start_import(uuid4())
+    records = _chunks(
+        (1, {"title": "a"}),
+        (2, {"title": ""}),
+        (3, {"title": "b", "assigned_to": str(uuid4())}),
+        (4, RecordError("Invalid JSON")),
+        (5, {"title": "c", "description": "tab\there\nback\\slash"}),
+    )
+
+    await task_import_service.import_tasks(db, report, records, uuid4(), batch_size=2)
+
+    raw.copy_to_table.assert_awaited_once()
+    assert [row[0] for row in raw.staged] == ["1", "3", "5"]
+    assert raw.staged[0][3] == "\\N"
+    assert raw.staged[2][3] == "tab\\there\\nback\\\\slash"
+    assert (report.rows_read, report.rows_invalid, report.rows_rejected, report.rows_imported) == (5, 2, 1, 2)
+    assert [(e.line, e.error) for e in report.errors] == [
+        (2, "title: String should have at least 1 character"),
+        (4, "Invalid JSON"),
+        (3, "Assigned user is not a project member"),
+    ]
+    assert report.status == "completed" and report.finished_at is not None
+    # Once for the permission checks before the upload is read, once for the merge
+    assert db.commit.await_count == 2
+    assert "clock_timestamp()" in str(db.execute.await_args_list[-1].args[0])
+    assert await task_import_service.get_import(report.project_id, report.id) == report
+    assert await task_import_service.get_import(uuid4(), report.id) is None
+    assert await task_import_service.list_imports(report.project_id) == [report]
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_marks_report_failed(import_db):
+    db, raw = import_db
+    raw.copy_to_table.side_effect = RuntimeError("connection lost")
+    report = await task_import_service.start_import(uuid4())
+
+    with pytest.raises(RuntimeError):
+        await task_import_service.import_tasks(db, report, _chunks((1, {"title": "a"})), uuid4(), batch_size=1)
+
+    assert report.status == "failed"
+    assert (await task_import_service.get_import(report.project_id, report.id)).status == "failed"
+    db.rollback.assert_awaited_once()
+    db.commit.assert_awaited_once()
@@ -2,7 +2,8 @@ import pytest
 from pydantic import ValidationError
 
 from app.enums import TaskPriority, TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.fields import partial_model
+from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
 
 
 def test_task_create_valid():
@@ -40,4 +41,12 @@ def test_task_update_partial():
 
 def test_task_update_title_empty_rejected():
     with pytest.raises(ValidationError):
-        TaskUpdate(title="")
\ No newline at end of file
+        TaskUpdate(title="")
+
+
+def test_partial_model_keeps_only_requested_fields():
+    model = partial_model(TaskResponse, ("id", "title", "status"))
+
+    assert list(model.model_fields) == ["id", "title", "status"]
+    assert model.model_fields["status"].annotation is TaskStatus
+    assert partial_model(TaskResponse, ("id", "title", "status")) is model
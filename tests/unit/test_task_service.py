@@ -7,8 +7,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.enums import TaskPriority, TaskStatus
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskCreate, TaskFilter, TaskResponse, TaskUpdate
 from app.services import task as task_service
+from app.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -20,6 +21,10 @@ def mock_db():
     return db
 
 
+def _statements(db):
+    return [call.args[0] for call in db.scalar.await_args_list + db.execute.await_args_list]
+
+
 @pytest.fixture
 def task_create_payload():
     return TaskCreate(
@@ -32,27 +37,54 @@ def task_create_payload():
     )
 
 
-async def _refresh(inst):
-    if getattr(inst, "id", None) is None:
-        inst.id = uuid4()
-    inst.created_at = getattr(inst, "created_at", None) or datetime.now()
-    inst.updated_at = getattr(inst, "updated_at", None) or datetime.now()
+@pytest.mark.asyncio
+async def test_create_task(mock_db, task_create_payload):
+    project_id = uuid4()
+    creator_id = uuid4()
+    created = Task(id=uuid4(), project_id=project_id, title="Test task", created_by=creator_id)
+    mock_db.scalar.return_value = created
+
+    task = await task_service.create_task(mock_db, project_id, task_create_payload, creator_id)
+
+    assert task is created
+    [stmt] = _statements(mock_db)
+    assert stmt.is_insert and stmt._returning
+    params = stmt.compile().params
+    assert params["title"] == "Test task"
+    assert params["created_by"] == creator_id
+    mock_db.commit.assert_awaited_once()
+    mock_db.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_create_task(mock_db, task_create_payload):
+async def test_create_tasks_uses_one_multi_row_insert(mock_db, task_create_payload):
     project_id = uuid4()
     creator_id = uuid4()
-    mock_db.refresh.side_effect = _refresh
+    rows = [
+        MagicMock(_mapping={"id": uuid4(), "project_id": project_id, "title": f"T{i}"})
+        for i in range(3)
+    ]
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": rows})
 
-    await task_service.create_task(mock_db, project_id, task_create_payload, creator_id)
+    tasks = await task_service.create_tasks(
+        mock_db, project_id, [task_create_payload] * 3, creator_id
+    )
 
-    mock_db.add.assert_called_once()
-    assert isinstance(mock_db.add.call_args[0][0], Task)
-    assert mock_db.add.call_args[0][0].title == "Test task"
-    assert mock_db.add.call_args[0][0].created_by == creator_id
+    assert [task.id for task in tasks] == [row._mapping["id"] for row in rows]
+    mock_db.execute.assert_awaited_once()
+    stmt, params = mock_db.execute.await_args.args
+    assert stmt.is_insert
+    assert "search_vector" not in {column.key for column in stmt._returning}
+    assert len(params) == 3
+    assert all(p["project_id"] == project_id and p["created_by"] == creator_id for p in params)
     mock_db.commit.assert_awaited_once()
-    mock_db.refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_empty_skips_db(mock_db):
+    assert await task_service.create_tasks(mock_db, uuid4(), [], uuid4()) == []
+    mock_db.execute.assert_not_awaited()
+    mock_db.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -72,13 +104,102 @@ async def test_update_task(mock_db):
         deleted_at=None,
     )
     update_data = TaskUpdate(title="New title", status=TaskStatus.DONE)
+    mock_db.scalar.return_value = task
+
+    assert await task_service.update_task(mock_db, task, update_data) is task
 
-    await task_service.update_task(mock_db, task, update_data)
+    [stmt] = _statements(mock_db)
+    assert stmt.is_update and stmt._returning
+    params = stmt.compile().params
+    assert params["title"] == "New title"
+    assert params["status"] == TaskStatus.DONE
+    mock_db.commit.assert_awaited_once()
+    mock_db.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_runs_one_update_per_group(mock_db):
+    project_id = uuid4()
+    ids = [uuid4(), uuid4(), uuid4()]
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": []})
+
+    await task_service.update_tasks(
+        mock_db, project_id,
+        [(ids[:2], {"status": TaskStatus.DONE}), (ids[2:], {"priority": TaskPriority.LOW})],
+    )
 
-    assert task.title == "New title"
-    assert task.status == TaskStatus.DONE
+    statements = [call.args[0] for call in mock_db.execute.await_args_list]
+    assert len(statements) == 2
+    assert all(stmt.is_update and stmt._returning for stmt in statements)
+    sql = str(statements[0])
+    assert "tasks.project_id = " in sql and "tasks.deleted_at IS NULL" in sql
     mock_db.commit.assert_awaited_once()
-    mock_db.refresh.assert_awaited_once_with(task)
+
+
+@pytest.mark.asyncio
+async def test_update_matching_tasks_rolls_back_over_limit(mock_db):
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": [MagicMock()] * 3})
+
+    with pytest.raises(task_service.TooManyTasksError):
+        await task_service.update_matching_tasks(
+            mock_db, uuid4(), TaskFilter(status=[TaskStatus.IN_PROGRESS]),
+            {"status": TaskStatus.DONE}, max_rows=2,
+        )
+
+    stmt = mock_db.execute.await_args.args[0]
+    assert "tasks.status IN" in str(stmt)
+    mock_db.rollback.assert_awaited_once()
+    mock_db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_and_restore_tasks_return_counts(mock_db):
+    project_id = uuid4()
+    mock_db.execute.return_value = MagicMock(rowcount=7)
+
+    deleted = await task_service.soft_delete_tasks(
+        mock_db, project_id, filters=TaskFilter(status=[TaskStatus.DONE])
+    )
+    restored = await task_service.restore_tasks(mock_db, project_id, ids=[uuid4()])
+
+    assert (deleted, restored) == (7, 7)
+    delete_stmt, restore_stmt = [call.args[0] for call in mock_db.execute.await_args_list]
+    assert delete_stmt.is_update and not delete_stmt._returning
+    assert "tasks.deleted_at IS NULL" in str(delete_stmt)
+    assert "tasks.status IN" in str(delete_stmt)
+    assert "tasks.deleted_at IS NOT NULL" in str(restore_stmt)
+    assert "tasks.id IN" in str(restore_stmt)
+    assert mock_db.commit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_task_with_expected_version_is_conditional(mock_db):
+    from app.utils.etag import VersionConflictError
+
+    task = Task(id=uuid4(), project_id=uuid4(), title="Old", version=3)
+    mock_db.scalar.return_value = None
+
+    with pytest.raises(VersionConflictError):
+        await task_service.update_task(mock_db, task, TaskUpdate(title="New"), expected_version=3)
+
+    stmt = mock_db.scalar.await_args.args[0]
+    assert "tasks.version = " in str(stmt)
+    assert 3 in stmt.compile().params.values()
+    mock_db.commit.assert_not_awaited()
+
+    with pytest.raises(VersionConflictError):
+        await task_service.update_task(mock_db, task, TaskUpdate(title="New"), expected_version=2)
+    assert mock_db.scalar.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_task_without_changes_skips_db(mock_db):
+    task = Task(id=uuid4(), project_id=uuid4(), title="Old")
+
+    assert await task_service.update_task(mock_db, task, TaskUpdate()) is task
+
+    assert _statements(mock_db) == []
+    mock_db.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -101,4 +222,212 @@ async def test_delete_task_soft(mock_db):
     await task_service.delete_task(mock_db, task)
 
     assert task.deleted_at is not None
-    mock_db.commit.assert_awaited_once()
\ No newline at end of file
+    mock_db.commit.assert_awaited_once()
+
+def _tasks(n):
+    return [Task(id=uuid4(), project_id=uuid4(), title=f"T{i}") for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_returns_next_cursor_when_more_rows(mock_db):
+    rows = _tasks(3)
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": rows})
+
+    tasks, next_cursor = await task_service.get_project_tasks(mock_db, uuid4(), limit=2)
+
+    assert tasks == rows[:2]
+    assert decode_cursor(next_cursor) == {"id": str(rows[1].id)}
+    stmt = mock_db.execute.await_args.args[0]
+    assert stmt._limit == 3
+
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_seeks_past_cursor(mock_db):
+    after = uuid4()
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": _tasks(1)})
+
+    tasks, next_cursor = await task_service.get_project_tasks(
+        mock_db, uuid4(), limit=5, cursor=encode_cursor({"id": str(after)})
+    )
+
+    assert len(tasks) == 1
+    assert next_cursor is None
+    stmt = mock_db.execute.await_args.args[0]
+    assert "tasks.id > " in str(stmt)
+    assert after in stmt.compile().params.values()
+
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_rejects_garbage_cursor(mock_db):
+    with pytest.raises(InvalidCursorError):
+        await task_service.get_project_tasks(mock_db, uuid4(), limit=5, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_applies_filters_and_sort(mock_db):
+    rows = _tasks(2)
+    for row in rows:
+        row.due_date = None
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": rows})
+
+    _, next_cursor = await task_service.get_project_tasks(
+        mock_db, uuid4(), limit=1, sort="-due_date",
+        filters=TaskFilter(status=[TaskStatus.TODO], unassigned=True),
+    )
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "tasks.status IN" in sql
+    assert "tasks.assigned_to IS NULL" in sql
+    assert "ORDER BY tasks.due_date DESC, tasks.id DESC" in sql
+    assert decode_cursor(next_cursor) == {"id": str(rows[0].id), "sort": "-due_date", "value": None}
+
+    await task_service.get_project_tasks(mock_db, uuid4(), limit=1, sort="-due_date", cursor=next_cursor)
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "tasks.due_date IS NULL AND tasks.id <" in sql
+    assert "tasks.due_date IS NOT NULL" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_rejects_cursor_from_other_sort(mock_db):
+    cursor = encode_cursor({"id": str(uuid4())})
+    with pytest.raises(InvalidCursorError):
+        await task_service.get_project_tasks(mock_db, uuid4(), limit=5, sort="priority", cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_ranks_and_scopes_to_memberships(mock_db):
+    rows = _tasks(2)
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": [(rows[0], 0.5), (rows[1], 0.25)]})
+    member_id = uuid4()
+
+    hits, next_cursor = await task_service.search_tasks(mock_db, "login bug", limit=1, member_id=member_id)
+
+    assert hits == [(rows[0], 0.5)]
+    assert decode_cursor(next_cursor) == {"id": str(rows[0].id), "rank": 0.5}
+    stmt = mock_db.execute.await_args.args[0]
+    sql = str(stmt)
+    assert "tasks.search_vector @@ websearch_to_tsquery" in sql
+    assert "tasks.project_id IN (SELECT project_members.project_id" in sql
+    assert "ORDER BY rank DESC, tasks.id DESC" in sql
+    assert member_id in stmt.compile().params.values()
+
+    await task_service.search_tasks(mock_db, "login bug", limit=1, member_id=member_id, cursor=next_cursor)
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "(ts_rank_cd(tasks.search_vector, websearch_to_tsquery" in sql
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_rejects_garbage_cursor(mock_db):
+    with pytest.raises(InvalidCursorError):
+        await task_service.search_tasks(mock_db, "x", limit=5, cursor=encode_cursor({"id": str(uuid4())}))
+
+
+@pytest.mark.asyncio
+async def test_get_assigned_tasks_checks_membership_in_query(mock_db):
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": []})
+    user_id = uuid4()
+
+    await task_service.get_assigned_tasks(
+        mock_db, user_id, limit=10, filters=TaskFilter(status=[TaskStatus.TODO]), sort="due_date"
+    )
+
+    stmt = mock_db.execute.await_args.args[0]
+    sql = str(stmt)
+    assert "tasks.assigned_to = " in sql
+    assert "tasks.project_id IN (SELECT project_members.project_id" in sql
+    assert "tasks.status IN" in sql
+    assert "ORDER BY tasks.due_date ASC, tasks.id ASC" in sql
+    assert mock_db.execute.await_count == 1
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        TaskFilter(),
+        TaskFilter(status=[], priority=[]),
+        TaskFilter(status=[TaskStatus.DONE]),
+        TaskFilter(unassigned=True),
+        TaskFilter(assigned_to=uuid4()),
+        TaskFilter(due_before=datetime(2026, 1, 1)),
+    ],
+)
+def test_filter_has_criteria_matches_conditions(filters):
+    assert filters.has_criteria == bool(task_service.task_filter_conditions(filters))
+
+
+@pytest.mark.asyncio
+async def test_pages_select_response_columns_in_order(mock_db):
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": []})
+
+    await task_service.get_project_tasks(mock_db, uuid4(), limit=10)
+    stmt = mock_db.execute.await_args.args[0]
+
+    assert [column.key for column in stmt.selected_columns] == list(TaskResponse.model_fields)
+
+    await task_service.get_project_tasks(mock_db, uuid4(), limit=10, sort="priority", fields=("id", "title"))
+    stmt = mock_db.execute.await_args.args[0]
+
+    assert [column.key for column in stmt.selected_columns] == ["id", "title", "priority"]
+
+
+@pytest.mark.asyncio
+async def test_fields_narrow_the_select(mock_db):
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": []})
+
+    await task_service.get_project_tasks(mock_db, uuid4(), limit=10, sort="-due_date", fields=("id", "title"))
+
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "tasks.title" in sql and "tasks.due_date" in sql
+    assert "tasks.description" not in sql
+
+    mock_db.execute.return_value = MagicMock(**{"scalar_one_or_none.return_value": None})
+    await task_service.get_task(mock_db, uuid4(), ("id", "status"))
+
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "tasks.project_id" in sql and "tasks.status" in sql
+    assert "tasks.description" not in sql
+
+
+@pytest.mark.asyncio
+async def test_project_tasks_state_is_a_single_aggregate(mock_db):
+    updated = datetime.now()
+    mock_db.execute.return_value = MagicMock(**{"one.return_value": (3, 7, updated, None)})
+
+    state = await task_service.get_project_tasks_state(mock_db, uuid4())
+
+    assert state == (3, 7, updated, None)
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "count(*)" in sql and "sum(tasks.version)" in sql
+    assert "max(tasks.updated_at)" in sql and "max(tasks.deleted_at)" in sql
+    assert "deleted_at IS NULL" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_advances_watermark(mock_db):
+    rows = _tasks(3)
+    for i, row in enumerate(rows):
+        row.updated_at = datetime(2026, 1, 1, 12, i)
+    mock_db.execute.return_value = MagicMock(**{"scalars.return_value.all.return_value": rows})
+
+    tasks, watermark, has_more = await task_service.get_task_changes(
+        mock_db, uuid4(), since=None, limit=2, settle_seconds=5
+    )
+
+    assert tasks == rows[:2] and has_more
+    assert decode_cursor(watermark) == {"updated_at": rows[1].updated_at.isoformat(), "id": str(rows[1].id)}
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "tasks.updated_at <= now() - " in sql
+    assert "deleted_at" not in sql.split("WHERE")[1]
+    assert "ORDER BY tasks.updated_at, tasks.id" in sql
+
+    mock_db.execute.return_value = MagicMock(**{"scalars.return_value.all.return_value": []})
+    tasks, next_watermark, has_more = await task_service.get_task_changes(
+        mock_db, uuid4(), since=watermark, limit=2, settle_seconds=5
+    )
+    assert (tasks, next_watermark, has_more) == ([], watermark, False)
+    assert "(tasks.updated_at, tasks.id) > " in str(mock_db.execute.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_rejects_bad_watermark(mock_db):
+    with pytest.raises(InvalidCursorError):
+        await task_service.get_task_changes(mock_db, uuid4(), since=encode_cursor({"id": "x"}), limit=5, settle_seconds=0)